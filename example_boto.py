@@ -1,11 +1,13 @@
-#!python2
-#!/usr/bin/python
-# -*- coding: utf-8 -*-
+#!python3
 
 """
-Example code to upload and download files from AWS S3 using boto.
+Example code to upload and download files from AWS S3 using boto3.
 
-Compatible with Python 2.7.
+A single S3 client is shared between all AWSS3 instances created with
+the same credentials so that its HTTPS connection pool (and therefore
+the TLS, DNS and TCP setup cost) is reused across requests.
+
+Compatible with Python 3.x.
 
 ---
 Authors: Ali Al-Hakim
@@ -14,23 +16,33 @@ Last Updated: 21 March 2020
 
 # Standard library imports
 import os
+import mmap
+import posixpath
+import time
+import random
 import hashlib
 import logging
+import shutil
+import threading
+import concurrent.futures
 import dotenv  # pip install python-dotenv
 
 # Third-party library imports
-from boto.s3.connection import S3Connection
-from boto.s3.bucket import Bucket as S3Bucket
-from boto.s3.key import Key as S3Key
-from boto.exception import S3ResponseError
+import boto3
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError
+from botocore.exceptions import ClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
+from botocore.exceptions import HTTPClientError
 
 
 #######################################################################
-# Setup logging
-USE_LOGGER = False
-if USE_LOGGER is True:
-    import logging
-    debugLogger = logging.getLogger(__name__)
+# Setup logging. Messages are discarded unless the application using
+# this module configures logging (see the __main__ block below).
+debugLogger = logging.getLogger(__name__)
+debugLogger.addHandler(logging.NullHandler())
 
 
 #######################################################################
@@ -40,13 +52,87 @@ S3_ACCESS_KEY = os.environ["S3_ACCESS_KEY"]
 S3_SECRET_KEY = os.environ["S3_SECRET_KEY"]
 S3_BUCKET = os.environ["S3_BUCKET"]
 
+# Configuration shared by every S3 client created by this module.
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 10, "mode": "adaptive"}
+)
+
+# Files larger than 'multipart_threshold' are transferred in parts of
+# 'multipart_chunksize' bytes, 'max_concurrency' parts at a time.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8*1024*1024,
+    multipart_chunksize=16*1024*1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# Maximum number of keys S3 accepts in a single DeleteObjects request.
+DELETE_BATCH_SIZE = 1000
+
+# Number of times _retry() will attempt an operation before giving up.
+RETRY_ATTEMPTS = 5
+
+# Key listings are cached for LISTING_TTL seconds. At most
+# LISTING_CACHE_SIZE listings (one per bucket and prefix) are kept.
+LISTING_TTL = 60
+LISTING_CACHE_SIZE = 128
+
+# S3 clients indexed by (access key ID, region, endpoint, timeout).
+_CLIENT_CACHE = {}
+
+# Bucket regions indexed by bucket name.
+_BUCKET_REGIONS = {}
+
 
 ########################################################################
 class AWSS3(object):
-    def __init__(self, access_key, secret_key, bucket, verbose=False):
+    def __init__(self, access_key, secret_key, bucket, verbose=False, use_accelerate=False,
+                 socket_timeout=None, reap_after=None):
+        """
+        Parameters
+        ==========
+        access_key, secret_key, bucket:
+            See connect().
+
+        verbose=False: <boolean>
+            Set True to log the outcome of each operation.
+
+        use_accelerate=False: <boolean>
+            Set True to use the S3 Transfer Acceleration endpoint, which
+            routes requests through the nearest CloudFront edge
+            location. Transfer Acceleration must be enabled on the
+            bucket. For read-heavy workloads, serving the bucket through
+            CloudFront is the next step.
+
+        socket_timeout=None: <number>
+            Seconds to wait for a connection to open or for data to be
+            received before giving up. If None botocore's default (60
+            seconds) is used.
+
+        reap_after=None: <integer>
+            If set, pooled connections are closed (see reap()) after
+            every 'reap_after' uploads, downloads or deletes. The
+            instance is then given its own client rather than the one
+            shared through _get_client(), so reaping it doesn't close
+            the connections of other instances.
+        """
         self.verbose = verbose
+        self.use_accelerate = use_accelerate
+        self.socket_timeout = socket_timeout
+        self.reap_after = reap_after
+        self._listings = {}
+        self._checksums = {}
+        self._requests = 0
+        self._requests_lock = threading.Lock()
         self.connect(access_key, secret_key, bucket)
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     ####################################################################
     # CONNECTIONS
     def connect(self, access_key, secret_key, bucket):
@@ -57,11 +143,11 @@ class AWSS3(object):
         ===========
         The connection is established and maintained from the following
         attributes generated when this method is called:
-            self.conn: <boto.s3.connection.S3Connection>
-            self.bucket: <boto.s3.bucket.Bucket>
-            self.key: <boto.s3.key.Key>
-        See boto API docs:
-            https://boto.readthedocs.io/en/latest/ref/s3.html
+            self.client: <botocore.client.S3>
+            self.bucket_name: <string>
+        The client is pinned to the region of 'bucket'.
+        See boto3 API docs:
+            https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html
 
         Parameters
         ==========
@@ -85,36 +171,35 @@ class AWSS3(object):
         ======
         Nothing.
         """
-        if self.verbose: _print("INFO", "Connecting to server")
-        try:
-            self._set_connection(access_key, secret_key)
-        except Exception as e:
-            if self.verbose: _print("ERROR", "Could not connect to server.\n\n{}\n".format(e))
-            self.connection_established = False
-            return
-
+        if self.verbose: debugLogger.info("Connecting to server")
         try:
-            self.set_bucket(bucket)
+            if self._set_connection(access_key, secret_key, bucket) is False:
+                raise ConnectionError("No client was created")
         except Exception as e:
-            if self.verbose: _print("ERROR", "Could not find bucket.\n\n{}\n".format(e))
-            self.close
+            if self.verbose: debugLogger.error("Could not connect to server.\n\n%s\n", e)
             self.connection_established = False
             return
 
         try:
-            self._set_key()
+            if self.set_bucket(bucket) is False:
+                raise LookupError("Bucket '{}' could not be accessed".format(bucket))
         except Exception as e:
-            if self.verbose: _print("ERROR", "Incorrect key. Connection aborted.\n\n{}\n".format(e))
-            self.close
+            if self.verbose: debugLogger.error("Could not find bucket.\n\n%s\n", e)
+            self.close()
             self.connection_established = False
             return
 
-        if self.verbose: _print("INFO", "Successfully connected to bucket '{}'".format(bucket))
+        if self.verbose: debugLogger.info("Successfully connected to bucket '%s'", bucket)
         self.connection_established = True
 
-    def _set_connection(self, access_key, secret_key):
+    def _set_connection(self, access_key, secret_key, bucket=None):
         """
-        Create a <boto.s3.connection.S3Connection> attribute: self.conn
+        Create a <botocore.client.S3> attribute: self.client
+
+        The client is shared with any other AWSS3 instance created with
+        the same credentials, region and endpoint (see _get_client()).
+        If 'bucket' is given the client is created in its region, which
+        saves S3 from redirecting requests made to the wrong region.
 
         Parameters
         ==========
@@ -127,6 +212,9 @@ class AWSS3(object):
             already knows it (like a password). If lost, a new secret
             key must be generated.
 
+        bucket=None: <string>
+            Name of the bucket which will be accessed.
+
         Returns
         =======
         <boolean>
@@ -137,15 +225,23 @@ class AWSS3(object):
         Nothing.
         """
         try:
-            self.conn = S3Connection(access_key, secret_key)
-        except S3ResponseError as err:
-            if self.verbose: _print("ERROR", "{}\n".format(err))
+            region = None if bucket is None else _get_bucket_region(access_key, secret_key, bucket)
+            self._owns_client = self.reap_after is not None
+            self.client = _get_client(
+                access_key, secret_key, region, self.use_accelerate, self.socket_timeout,
+                shared=not self._owns_client
+            )
+        except (BotoCoreError, ClientError) as err:
+            if self.verbose: debugLogger.error("%s\n", err)
             return False
         return True
 
     def set_bucket(self, bucket):
         """
-        Create a <boto.s3.bucket.Bucket> attribute: self.bucket
+        Set the name of the active bucket: self.bucket_name
+
+        A HEAD request is made to confirm the bucket exists and can be
+        accessed with the current credentials.
 
         Parameters
         ==========
@@ -162,30 +258,11 @@ class AWSS3(object):
         Nothing.
         """
         try:
-            self.bucket = self.conn.get_bucket(bucket)
-        except S3ResponseError as err:
-            if self.verbose: _print("ERROR", "{}\n".format(err))
-            return False
-        return True
-
-    def _set_key(self):
-        """
-        Create a <boto.s3.key.Key> attribute: self.key
-
-        Returns
-        =======
-        <boolean>
-        Indicate if the attribute was successfully created.
-
-        Raises
-        ======
-        Nothing.
-        """
-        try:
-            self.key = S3Key(self.bucket)
-        except AttributeError as err:
-            if self.verbose: _print("ERROR", "{}\n".format(err))
+            _retry(self.client.head_bucket, Bucket=bucket)
+        except ClientError as err:
+            if self.verbose: debugLogger.error("%s\n", err)
             return False
+        self.bucket_name = bucket
         return True
 
     def reconnect(self, access_key, secret_key, bucket):
@@ -234,11 +311,52 @@ class AWSS3(object):
     def close(self):
         """
         Close connections waiting to close.
+
+        A client shared with other AWSS3 instances (see _get_client())
+        is left open, as closing it would also close their connections.
+        Its pooled connections are released when the process exits.
         """
-        if self.verbose: _print("INFO", "Closing open connections")
-        self.conn.close()
+        if self.verbose: debugLogger.info("Closing open connections")
+        client = getattr(self, "client", None)
+        if client is not None and getattr(self, "_owns_client", False):
+            client.close()
         self.connection_established = False
 
+    def reap(self):
+        """
+        Close all pooled connections without closing the session.
+
+        Description
+        ===========
+        Sockets which the server has closed can linger in the pool in
+        the CLOSE_WAIT state until they are reused, and in a long
+        running process they may accumulate until the open file limit
+        is reached. Closing the pool releases them; new connections
+        are opened on demand by the next request.
+
+        Only a client owned by this instance is reaped (see
+        'reap_after' in __init__()). A shared client is left alone, as
+        other instances may be using its connections.
+        """
+        if not getattr(self, "_owns_client", False):
+            return
+        if self.verbose: debugLogger.debug("Reaping pooled connections")
+        self.client.close()
+
+    def _count_request(self):
+        """
+        Count an upload, download or delete and reap the connection pool
+        every 'self.reap_after' requests.
+        """
+        if self.reap_after is None:
+            return
+
+        with self._requests_lock:
+            self._requests += 1
+            due = self._requests % self.reap_after == 0
+        if due:
+            self.reap()
+
     ####################################################################
     # DATA RETRIEVAL
     def get_bucket_name(self):
@@ -248,25 +366,30 @@ class AWSS3(object):
         Returns
         =======
         <string>
-        Name of currently selected bucket (self.bucket.name).
+        Name of currently selected bucket (self.bucket_name).
 
         Raises
         ======
         Nothing.
         """
-        return self.bucket.name
+        return self.bucket_name
 
     def get_key(self, keyname, validate=False):
         """
-        Return a <boto.s3.key.Key> object with name "keyname".
+        Return a <dict> describing the key with name "keyname".
 
         Description
         ===========
         Depending on the value of 'validate' this method will either
-        retrieve a <boto.s3.key.Key> object through an API request or
-        create the object in memory only, which is quicker. Although the
-        API request is slower because of a communication delay, it will
-        also return metadata (such as if the key exists, size, etag).
+        retrieve the key metadata through an API request (HEAD) or
+        create a description in memory only, which is quicker. Although
+        the API request is slower because of a communication delay, it
+        will also return metadata (such as if the key exists, size,
+        etag).
+
+        The transfer and delete methods of this class take key names
+        directly, so a key description without metadata is only needed
+        by callers which want one.
 
         Parameters
         ==========
@@ -275,51 +398,115 @@ class AWSS3(object):
 
         validate=False: <boolean>
             Set True to make an API request, or False to create the key
-            object in memory only.
+            description in memory only.
 
         Returns
         =======
-        <boto.s3.key.Key>
-        S3 key object with or without metadata (based off validate)
+        <dict>
+        The response of a head_object request with an additional "Key"
+        item if 'validate' is True, else a dictionary with the "Key"
+        item only.
+
+        <None>
+        If 'validate' is True and the key does not exist.
 
         Raises
         ======
-        Nothing.
+        <botocore.exceptions.ClientError>
+        If the HEAD request fails for any reason other than HTTP 404.
         """
         # See description above for advice on validate.
-        return self.bucket.get_key(keyname, validate=validate)
+        if validate is False:
+            return {"Key": keyname}
+        return self._head_object(keyname)
+
+    def _head_object(self, keyname):
+        """
+        Return the metadata of 'keyname' from a single HEAD request.
+
+        Description
+        ===========
+        The head_object response includes the "ETag", "ContentLength"
+        and "LastModified" of the key, which is everything needed to
+        decide whether a transfer is required. If a recent cached
+        listing covers 'keyname' it is used instead of a request.
+
+        Parameters
+        ==========
+        keyname: <string>
+            Name of the key of interest.
+
+        Returns
+        =======
+        <dict>
+        The head_object response with an additional "Key" item.
+
+        <None>
+        If the key does not exist.
+
+        Raises
+        ======
+        <botocore.exceptions.ClientError>
+        If the HEAD request fails for any reason other than HTTP 404.
+        """
+        # A recent listing which covers 'keyname' already says whether
+        # it exists, so the HEAD request can be skipped.
+        listing = self._get_cached_listing(keyname)
+        if listing is not None:
+            if keyname not in listing:
+                return None
+            # None marks a key which was modified after it was listed.
+            entry = listing[keyname]
+            if entry is not None:
+                return {
+                    "Key": keyname,
+                    "ETag": entry["ETag"],
+                    "ContentLength": entry["Size"],
+                    "LastModified": entry["LastModified"]
+                }
+
+        try:
+            key = self.client.head_object(Bucket=self.bucket_name, Key=keyname)
+        except ClientError as err:
+            if err.response["Error"]["Code"] != "404":
+                raise
+            return None
+
+        key["Key"] = keyname
+        return key
 
     def get_all_keys(self):
         """
-        Return a list of all keys in the active bucket.
+        Yield all keys in the active bucket.
 
         Returns
         =======
-        [list of <boto.s3.key.Key>]
-        List of S3 key objects representing all of the keys in the
-        currently active bucket (self.bucket).
+        <generator> of <dict>
+        Key descriptions ("Key", "ETag", "Size", ...) for all of the
+        keys in the currently active bucket (self.bucket_name).
 
         Raises
         ======
         Nothing.
         """
-        return [key for key in self.bucket.list()]
+        yield from self._list_keys()
 
     def get_keys_from_path(self, path):
         """
-        Return a list of keys from a known keypath
+        Yield the keys from a known keypath
 
         Returns
         =======
-        [list of <boto.s3.key.Key>]
-        List of S3 key objects representing all of the keys in the
-        defined directory of the active bucket (self.bucket).
+        <generator> of <dict>
+        Key descriptions ("Key", "ETag", "Size", ...) for all of the
+        keys in the defined directory of the active bucket
+        (self.bucket_name).
 
         Raises
         ======
         Nothing.
         """
-        return [key for key in self.bucket.list(prefix=path.replace("\\", "/"))]
+        yield from self._list_keys(_to_posix(path))
 
     def get_all_keynames(self, prefix=""):
         """
@@ -336,12 +523,98 @@ class AWSS3(object):
         ======
         Nothing.
         """
-        return [os.path.normpath(key.name).replace("\\", "/") for key in self.bucket.list(prefix)]
+        # Keys always use "/" so posixpath gives the same result as
+        # os.path followed by replacing "\\" on Windows.
+        return [posixpath.normpath(key["Key"]) for key in self._list_keys(prefix)]
+
+    def _list_keys(self, prefix=""):
+        """
+        Yield the keys which start with 'prefix'.
+
+        Description
+        ===========
+        S3 returns at most 1000 keys per LIST request so a paginator is
+        used to collect all of the matching keys. Keys are yielded as
+        each page arrives, so callers can start working on the first
+        page while the next one is requested. LIST requests are
+        expensive, so a complete listing is cached for LISTING_TTL
+        seconds and also used by get_key() to avoid HEAD requests.
+
+        Parameters
+        ==========
+        prefix="": <string>
+            Only keys starting with 'prefix' are returned. By default
+            all keys in the active bucket are returned.
+
+        Returns
+        =======
+        <generator> of <dict>
+        Key descriptions as returned by list_objects_v2.
+
+        Raises
+        ======
+        Nothing.
+        """
+        # A listing holding a key modified since it was made no longer
+        # knows that key's description, so it is listed again.
+        cached = self._listings.get((self.bucket_name, prefix))
+        if cached is not None and time.monotonic() - cached[0] < LISTING_TTL and None not in cached[1].values():
+            yield from list(cached[1].values())
+            return
+
+        paginator = self.client.get_paginator("list_objects_v2")
+
+        keys = {}
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for key in page.get("Contents", []):
+                keys[key["Key"]] = key
+                yield key
+
+        # Drop the oldest listing to make room for this one.
+        if len(self._listings) >= LISTING_CACHE_SIZE:
+            oldest = min(self._listings.items(), key=lambda item: item[1][0])[0]
+            self._listings.pop(oldest, None)
+        self._listings[(self.bucket_name, prefix)] = (time.monotonic(), keys)
+
+    def _get_cached_listing(self, keyname):
+        """
+        Return a recent listing of the active bucket which covers
+        'keyname' as a <dict> of key descriptions indexed by key name,
+        or None if there isn't one.
+        """
+        now = time.monotonic()
+        for (bucket, prefix), (timestamp, keys) in list(self._listings.items()):
+            if bucket == self.bucket_name and keyname.startswith(prefix) and now - timestamp < LISTING_TTL:
+                return keys
+        return None
+
+    def _invalidate_listings(self, keyname, deleted=False):
+        """
+        Update 'keyname' in every cached listing which covers it. This
+        must be called whenever 'keyname' is modified.
+
+        A deleted key is removed from the listings. Otherwise its
+        description is replaced with None so the next lookup of that
+        key makes a HEAD request, while the rest of each listing stays
+        in use.
+        """
+        for (bucket, prefix), (timestamp, keys) in list(self._listings.items()):
+            if bucket == self.bucket_name and keyname.startswith(prefix):
+                if deleted is True:
+                    keys.pop(keyname, None)
+                else:
+                    keys[keyname] = None
 
     def _md5_checksum(self, filepath):
         """
         Complete an md5 checksum on a file.
 
+        Description
+        ===========
+        The file is handed to hashlib in a single call, either through
+        hashlib.file_digest() (Python 3.11+) or as a memory map, rather
+        than being read and hashed in small blocks from Python.
+
         Parameters
         ==========
         filepath: <string>
@@ -358,12 +631,70 @@ class AWSS3(object):
         Nothing.
 
         """
-        m = hashlib.md5()
         with open(filepath, "rb") as f:
-            for block in iter(lambda: f.read(4096), ""):
-                m.update(block)
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "md5").hexdigest()
+
+            m = hashlib.md5()
+            # An empty file cannot be memory mapped.
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    m.update(mm)
         return m.hexdigest()
 
+    def _etag_checksum(self, filepath):
+        """
+        Calculate the ETag S3 gives a file uploaded by this module.
+
+        Description
+        ===========
+        Files uploaded in a single part have an ETag equal to the md5
+        checksum of their contents. Files large enough to be uploaded in
+        multiple parts (see TRANSFER_CONFIG) have an ETag made from the
+        md5 checksum of the concatenated md5 digests of each part,
+        followed by '-' and the number of parts.
+
+        Checksums are cached against the file's size and modification
+        time, so an unchanged file is only read the first time it is
+        compared.
+
+        Parameters
+        ==========
+        filepath: <string>
+            Absolute file path (i.e. root/dir1/dir2/filename.log) of the
+            file to be checksummed.
+
+        Returns
+        =======
+        <string>
+        The expected ETag of the inserted file, without quotes.
+
+        Raises
+        ======
+        Nothing.
+        """
+        stat = os.stat(filepath)
+        cached = self._checksums.get(filepath)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        if stat.st_size < TRANSFER_CONFIG.multipart_threshold:
+            etag = self._md5_checksum(filepath)
+
+        else:
+            digests = []
+            chunksize = TRANSFER_CONFIG.multipart_chunksize
+            with open(filepath, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Slicing a memoryview hashes each part without copying it.
+                    with memoryview(mm) as view:
+                        for start in range(0, len(view), chunksize):
+                            digests.append(hashlib.md5(view[start:start+chunksize]).digest())
+            etag = "{}-{}".format(hashlib.md5(b"".join(digests)).hexdigest(), len(digests))
+
+        self._checksums[filepath] = (stat.st_mtime_ns, stat.st_size, etag)
+        return etag
+
     ####################################################################
     # DOWNLOADING
     def download_file(self, src_dir, dst_dir, filename, checksum=True, versioned=False, backup=False):
@@ -374,40 +705,61 @@ class AWSS3(object):
 
         """
         # Create a filepath from the source directory and filename.
-        src_filepath = os.path.join(src_dir, filename).replace("\\", "/")
+        src_filepath = posix_filepath(src_dir, filename)
 
         # Check if a connection is established.
         if not self.connection_established:
             self._download_message(False, src_filepath)
             return False
 
+        # Check if the key even exists
+        key = self._head_object(src_filepath)
+        if key is None:
+            if self.verbose: debugLogger.info("'%s' does not exist.", src_filepath)
+            return False
+
         # Download the target file if a connection is established.
-        key = self.get_key(src_filepath, validate=True)
         return self._download_from_key(key, dst_dir, checksum, versioned, backup)
 
-    def download_directory(self, src_dir, dst_dir, checksum=True, versioned=False, backup=False):
+    def download_directory(self, src_dir, dst_dir, checksum=True, versioned=False, backup=False, max_workers=16):
         """
         Download all files from 'src_dir'
+
+        Files are downloaded concurrently by a pool of 'max_workers'
+        threads which share the same S3 client. 'max_workers' should not
+        exceed the client's max_pool_connections (see CLIENT_CONFIG).
         """
         # Check if a connection is established.
         if not self.connection_established:
             self._download_message(False, src_dir)
             return False
 
-        # Find all keys which have 'src_dir' in their name
-        all_keys = self.get_all_keys()
-        directory = [key for key in all_keys if key.name.find(src_dir) != -1]
-
-        downloads = 0
-        for key in directory:
-            src_subdir = os.path.dirname(key.name.replace(src_dir, ""))
-            file_dst_dir = os.path.join(dst_dir, src_subdir.strip("/"))
-            file_dst_dir = os.path.normpath(file_dst_dir)
-            if self._download_from_key(key, file_dst_dir, checksum, versioned, backup):
-                downloads += 1
+        # Find all keys which start with 'src_dir'. The prefix filter is
+        # applied by S3 so only the matching keys are listed.
+        prefix = _to_posix(src_dir)
+        directory = self.get_keys_from_path(prefix)
+        total = 0
+
+        # Local destinations are worked out once per sub-directory rather
+        # than once per key.
+        dst_dirs = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = []
+            for key in directory:
+                total += 1
+                src_subdir = posixpath.dirname(key["Key"][len(prefix):])
+                file_dst_dir = dst_dirs.get(src_subdir)
+                if file_dst_dir is None:
+                    file_dst_dir = os.path.normpath(os.path.join(dst_dir, src_subdir.strip("/")))
+                    dst_dirs[src_subdir] = file_dst_dir
+                futures.append(executor.submit(
+                    self._download_from_key, key, file_dst_dir, checksum, versioned, backup
+                ))
+
+            downloads = sum(1 for f in concurrent.futures.as_completed(futures) if f.result())
 
         # Only return true if ALL files were downloaded successfully
-        return downloads == len(directory)
+        return downloads == total
 
     def _download_from_key(self, key, dst_dir, checksum=True, versioned=False, backup=False):
         """
@@ -425,11 +777,13 @@ class AWSS3(object):
         up for 'key' and the LATEST version of the file will be
         returned.
 
-        If 'backup' is True, the contents of the original file will be
-        saved in memory before being overwritten. Therefore, if there is
-        an error (specific error unknown, although some sort of
-        connection error) during the overwriting process, the in-memory
-        contents will be re-used to ensure no data loss.
+        If 'backup' is True, the original file will be moved aside
+        (renamed with a '.bak' extension) before being overwritten.
+        Therefore, if there is an error (specific error unknown,
+        although some sort of connection error) during the overwriting
+        process, the original file is moved back to ensure no data
+        loss. Renaming does not read the file, so this costs the same
+        for any file size.
 
         Note: A key with metadata is needed for the checksum
         calculation. Therefore, this function should be faster than
@@ -437,8 +791,10 @@ class AWSS3(object):
 
         Parameters
         ==========
-        key: <boto.s3.key.Key>
-            Boto key object of the file of interest
+        key: <dict>
+            Description of the file of interest, as returned by
+            _head_object() or a key listing. The "Key" and
+            "ETag" items are used.
 
         dst_dir: <string>
             Destination of the downloaded file. 'dst_dir' should be the
@@ -455,9 +811,9 @@ class AWSS3(object):
             description above for more details.
 
         backup=False: <boolean>
-            Whether the file being overwritten should be backed-up in
-            memory before being deleted and re-written with the new
-            contents. See description above for more details.
+            Whether the file being overwritten should be backed-up
+            before being re-written with the new contents. See
+            description above for more details.
 
         Returns
         =======
@@ -469,23 +825,19 @@ class AWSS3(object):
         ======
         Nothing.
         """
-        # Obtain the source location
-        self.key = key
-        src_filepath = self.key.name
+        # Obtain the source location. Keys from a listing have a "Size"
+        # and keys from a HEAD request have a "ContentLength".
+        src_filepath = key["Key"]
+        size = key.get("ContentLength", key.get("Size"))
 
         # Obtain the destination location
-        dst_filepath = os.path.join(dst_dir, os.path.basename(key.name))
+        dst_filepath = os.path.join(dst_dir, os.path.basename(src_filepath))
         dst_filepath = os.path.normpath(dst_filepath)
 
-        # Check if the key even exists
-        if self.key is None:
-            if self.verbose: _print("INFO", "'{}' does not exist.".format(src_filepath))
-            return False
-
         # Collect versioning data.
         version = None
         if versioned is True:
-            self._get_latest_version(src_filepath)
+            version = self._get_latest_version(src_filepath)
 
         # Update 'dst_filepath' if it does not yet exist or if there are
         # differences between the local and online versions, else do
@@ -495,82 +847,130 @@ class AWSS3(object):
         modified = None
         if os.path.exists(dst_dir):
             if os.path.isfile(dst_filepath):
-                # Copy the contents of an existing version of
-                # src_filepath if it already exists at the download
-                # destination. The get_contents_to_filename(arg)
-                # seems to delete the previous version of 'arg'
-                # before downloading the new one, hence the
-                # requirement to store the data and re-write it if
-                # the download fails.
-                text = None
-                if backup is True:
-                    with open(dst_filepath, 'rb') as rf:
-                        text = rf.read()
-
                 if checksum is True:
-                    md5 = self._md5_checksum(dst_filepath)
-                    etag = self.key.etag.strip('"').strip("'")
-                    modified = etag != md5
+                    # A change in size means the file was modified, which
+                    # saves reading the whole local file to checksum it.
+                    modified = size is not None and size != os.path.getsize(dst_filepath)
+                    if not modified:
+                        md5 = self._etag_checksum(dst_filepath)
+                        etag = key["ETag"].strip('"')
+                        modified = etag != md5
                     if modified:
-                        result = self._download(dst_filepath, version, text)
+                        result = self._download(src_filepath, dst_filepath, version, backup, size)
 
                 # If the file exists already, but the checksum is
                 # disabled, overwrite the existing file
                 else:
-                    result = self._download(dst_filepath, version, text)
+                    result = self._download(src_filepath, dst_filepath, version, backup, size)
 
             # If the file does not exist, download it
             else:
-                result = self._download(dst_filepath, version)
+                result = self._download(src_filepath, dst_filepath, version, size=size)
 
         # If the destination directory does not exist, create it and
-        # download the file into it.
+        # download the file into it. Other threads may be creating the
+        # same directory at the same time.
         else:
-            print("DST_DIR='{}'".format(dst_dir))
-            os.makedirs(dst_dir)
-            result = self._download(dst_filepath, version)
+            os.makedirs(dst_dir, exist_ok=True)
+            result = self._download(src_filepath, dst_filepath, version, size=size)
 
         self._download_message(result, src_filepath, modified)
         return result
 
     def _get_latest_version(self, filepath):
         """
+        Return the ID of the latest version of 'filepath'.
 
-        """
-        version_list = []
-        for v in self.bucket.list_versions(prefix=filepath):
-            version_list.append(v.version_id)
+        Description
+        ===========
+        S3 lists the versions of a key newest first, so only the first
+        entry is requested rather than the whole version history.
+
+        Parameters
+        ==========
+        filepath: <string>
+            Name of the key of interest.
 
-        # Return the latest version stored.
-        if len(version_list) != 0:
-            version = version_list[0]
+        Returns
+        =======
+        <string>
+        The version ID of the latest version.
+
+        <None>
+        If the key does not exist or its latest version is a delete
+        marker.
+
+        Raises
+        ======
+        Nothing.
+        """
+        response = self.client.list_object_versions(Bucket=self.bucket_name, Prefix=filepath, MaxKeys=1)
 
-        return version
+        # Return the latest version stored. The prefix also matches any
+        # longer key names, so check the entry is for 'filepath'.
+        for v in response.get("Versions", []):
+            if v["Key"] == filepath:
+                return v["VersionId"]
+        return None
 
-    def _download(self, dst_filepath, version=None, text=None):
+    def _download(self, keyname, dst_filepath, version=None, backup=False, size=None):
         """
-        Download 'dst_filepath' from S3 bucket.
+        Download 'keyname' from S3 bucket to 'dst_filepath'.
+
+        Objects smaller than the multipart threshold (see
+        TRANSFER_CONFIG) are streamed straight from a single GET
+        response into the file. Larger objects, or those of unknown
+        'size', are downloaded by the transfer manager with parallel
+        ranged GETs.
+
+        If 'backup' is True and 'dst_filepath' already exists, it is
+        renamed to 'dst_filepath.bak' during the download and restored
+        if the download fails.
         """
-        # try:
-        self.key.get_contents_to_filename(dst_filepath, version_id=version)
-        # except Exception as e:
-        #     if self.verbose: _print("ERROR", "Network is unreachable. Connection lost.\n    1\n{}\n".format(e))
-        #     self.connection_established = False
-        #     with open(dst_filepath, "w") as wf: wf.write(text)
-        #     return False
+        backup_filepath = None
+        if backup is True and os.path.isfile(dst_filepath):
+            backup_filepath = dst_filepath + ".bak"
+            os.replace(dst_filepath, backup_filepath)
+
+        extra_args = {} if version is None else {"VersionId": version}
+        try:
+            if size is not None and size < TRANSFER_CONFIG.multipart_threshold:
+                _retry(self._stream_to_file, keyname, dst_filepath, extra_args)
+            else:
+                _retry(
+                    self.client.download_file,
+                    self.bucket_name, keyname, dst_filepath, ExtraArgs=extra_args, Config=TRANSFER_CONFIG
+                )
+        except Exception:
+            if backup_filepath is not None:
+                os.replace(backup_filepath, dst_filepath)
+            raise
+
+        if backup_filepath is not None:
+            os.remove(backup_filepath)
+        self._count_request()
         return True
 
+    def _stream_to_file(self, keyname, dst_filepath, extra_args):
+        """
+        Write the body of a GET request for 'keyname' to 'dst_filepath'
+        in 1 MiB blocks.
+        """
+        response = self.client.get_object(Bucket=self.bucket_name, Key=keyname, **extra_args)
+        with open(dst_filepath, "wb") as wf:
+            shutil.copyfileobj(response["Body"], wf, length=1024*1024)
+
     def _download_message(self, successful, filepath, modified=None):
         if self.verbose:
             if successful:
                 if modified == True:
-                    _print("INFO", "Download: Updated '{}'".format(filepath))
+                    debugLogger.info("Download: Updated '%s'", filepath)
                 elif modified == False:
-                    _print("INFO", "Download: No change to '{}'".format(filepath))
+                    debugLogger.info("Download: No change to '%s'", filepath)
                 else:
-                    _print("INFO", "Download: Downloaded '{}'".format(filepath))
+                    debugLogger.info("Download: Downloaded '%s'", filepath)
             else:
-                _print("WARN", "'{}' could not be downloaded.".format(filepath))
+                debugLogger.warning("'%s' could not be downloaded.", filepath)
 
     ####################################################################
     # UPLOADING
@@ -603,39 +1003,86 @@ class AWSS3(object):
         Nothing.
         """
         # Create a filepath from the source directory and filename.
-        src_filepath = os.path.join(src_dir, filename).replace("\\", "/")
+        src_filepath = posix_filepath(src_dir, filename)
 
          # Check if a connection is established.
         if not self.connection_established:
             self._upload_message(False, src_filepath)
             return False
 
-        dst_filepath = os.path.join(dst_dir, filename).replace("\\", "/")
-        self.key = self.get_key(dst_filepath, validate=True)
+        dst_filepath = posix_filepath(dst_dir, filename)
+        key = self._head_object(dst_filepath)
 
         # Update 'dst_filepath' if it does not yet exist or if there are
         # differences between the local and online versions, else do
         # nothing.
         result = True
         modified = None
-        if self.key is None:
-            self.key = self.get_key(dst_filepath)
-            result = self._upload(src_filepath)
+        if key is None:
+            result = self._upload(src_filepath, dst_filepath)
         else:
-            md5 = self._md5_checksum(src_filepath)
-            etag = self.key.etag.strip('"').strip("'")
-            modified = etag != md5
+            # A change in size means the file was modified, which saves
+            # reading the whole local file to checksum it.
+            modified = key["ContentLength"] != os.path.getsize(src_filepath)
+            if not modified:
+                md5 = self._etag_checksum(src_filepath)
+                etag = key["ETag"].strip('"')
+                modified = etag != md5
             if modified:
-                result = self._upload(src_filepath)
+                result = self._upload(src_filepath, dst_filepath)
 
         self._upload_message(result, dst_filepath, modified)
         return result
 
-    def _upload(self, src_filepath):
+    def upload_many(self, files, max_workers=16):
+        """
+        Upload several files to the S3 server concurrently.
+
+        Description
+        ===========
+        Each file is passed to upload() by a pool of 'max_workers'
+        threads which share the same S3 client. While one file is being
+        transferred the next can already be checksummed, so the total
+        time approaches that of the slowest stage rather than the sum
+        of both. 'max_workers' should not exceed the client's
+        max_pool_connections (see CLIENT_CONFIG).
+
+        Parameters
+        ==========
+        files: [list of (<string>, <string>, <string>)]
+            The (src_dir, dst_dir, filename) arguments of upload() for
+            each file to be uploaded.
+
+        max_workers=16: <integer>
+            Maximum number of files uploaded at the same time.
+
+        Returns
+        =======
+        <boolean>
+        Indicate whether ALL files were uploaded successfully (or
+        already existed and did not need to be updated).
+
+        Raises
+        ======
+        Nothing.
+        """
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.upload, *args) for args in files]
+            uploads = sum(1 for f in concurrent.futures.as_completed(futures) if f.result())
+
+        # Only return true if ALL files were uploaded successfully
+        return uploads == len(futures)
+
+    def _upload(self, src_filepath, keyname):
+        """
+        Upload 'src_filepath' to 'keyname' in S3 bucket.
+        """
         # try:
-        self.key.set_contents_from_filename(src_filepath)
+        _retry(self.client.upload_file, src_filepath, self.bucket_name, keyname, Config=TRANSFER_CONFIG)
+        self._invalidate_listings(keyname)
+        self._count_request()
         # except Exception as e:
-        #     if self.verbose: _print("ERROR", "Network is unreachable. Connection lost.\n\n{}\n".format(e))
+        #     if self.verbose: debugLogger.error("Network is unreachable. Connection lost.\n\n%s\n", e)
         #     self.connection_established = False
         #     return False
         return True
@@ -644,19 +1091,19 @@ class AWSS3(object):
         if self.verbose:
             if successful:
                 if modified is True:
-                    _print("INFO", "Upload: Updated '{}'".format(filepath))
+                    debugLogger.info("Upload: Updated '%s'", filepath)
                 elif modified is False:
-                    _print("INFO", "Upload: No change to '{}'".format(filepath))
+                    debugLogger.info("Upload: No change to '%s'", filepath)
                 else:
-                    _print("INFO", "Upload: Uploaded '{}'".format(filepath))
+                    debugLogger.info("Upload: Uploaded '%s'", filepath)
             else:
-                _print("WARN", "'{}' was not uploaded.".format(filepath))
+                debugLogger.warning("'%s' was not uploaded.", filepath)
 
     ####################################################################
     # DELETING
     def delete(self, dirname, filename):
         # Create a filepath from the source directory and filename.
-        filepath = os.path.join(dirname, filename).replace("\\", "/")
+        filepath = posix_filepath(dirname, filename)
 
         # Check if a connection is established.
         if not self.connection_established:
@@ -665,49 +1112,330 @@ class AWSS3(object):
 
         # Delete the key online file if it exists.
         result = None
-        self.key = self.get_key(filepath, validate=True)
-        if self.key is not None:
-            result = self._delete()
+        if self._head_object(filepath) is not None:
+            result = self._delete(filepath)
 
         self._delete_message(result, filepath)
         return result
 
-    def _delete(self):
+    def _delete(self, keyname):
+        """
+        Delete 'keyname' from S3 bucket.
+        """
         # try:
-        self.key.delete()
+        _retry(self.client.delete_object, Bucket=self.bucket_name, Key=keyname)
+        self._invalidate_listings(keyname, deleted=True)
+        self._count_request()
         # except Exception as e:
-        #     if self.verbose: _print("ERROR", "Network is unreachable. Connection lost.\n\n{}\n".format(e))
+        #     if self.verbose: debugLogger.error("Network is unreachable. Connection lost.\n\n%s\n", e)
         #     self.connection_established = False
         #     return False
         return True
 
+    def delete_many(self, keynames, max_workers=4):
+        """
+        Delete several keys from the S3 server.
+
+        Description
+        ===========
+        Keys are deleted in batches of up to DELETE_BATCH_SIZE (1000)
+        with a single DeleteObjects request per batch, rather than one
+        DELETE request per key. Batches are sent concurrently by a pool
+        of 'max_workers' threads. Keys which do not exist are treated as
+        deleted.
+
+        Parameters
+        ==========
+        keynames: [list of <string>]
+            Names of the keys to be deleted.
+
+        max_workers=4: <integer>
+            Maximum number of batches deleted at the same time.
+
+        Returns
+        =======
+        <boolean>
+        Indicate whether ALL keys were deleted successfully.
+
+        Raises
+        ======
+        Nothing.
+        """
+        # Check if a connection is established.
+        if not self.connection_established:
+            self._delete_message(False, ", ".join(keynames))
+            return False
+
+        batches = [
+            keynames[i:i+DELETE_BATCH_SIZE] for i in range(0, len(keynames), DELETE_BATCH_SIZE)
+        ]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._delete_batch, batch) for batch in batches]
+            failures = sum(f.result() for f in concurrent.futures.as_completed(futures))
+
+        # Only return true if ALL keys were deleted successfully
+        return failures == 0
+
+    def _delete_batch(self, keynames):
+        """
+        Delete up to DELETE_BATCH_SIZE keys in one request and return
+        the number of keys which could not be deleted.
+        """
+        # Quiet mode only reports the keys which could not be deleted.
+        response = _retry(
+            self.client.delete_objects,
+            Bucket=self.bucket_name,
+            Delete={"Objects": [{"Key": keyname} for keyname in keynames], "Quiet": True}
+        )
+        self._count_request()
+
+        errors = response.get("Errors", [])
+        failed = {error["Key"] for error in errors}
+        for keyname in keynames:
+            self._invalidate_listings(keyname, deleted=keyname not in failed)
+        for error in errors:
+            self._delete_message(False, error["Key"])
+        return len(errors)
+
     def _delete_message(self, successful, filepath):
         if self.verbose:
             if successful is None:
-                _print("WARN",
-                    "'{}' could not be deleted because it does not exist.".format(filepath)
-                    )
+                debugLogger.warning("'%s' could not be deleted because it does not exist.", filepath)
             elif successful:
-                _print("INFO", "Deleted '{}'.".format(filepath))
+                debugLogger.info("Deleted '%s'.", filepath)
+            else:
+                debugLogger.warning("'%s' could not be deleted.", filepath)
+
+    ####################################################################
+    # BATCH OPERATIONS
+    def batch_op(self, ops, max_workers=16):
+        """
+        Run a series of uploads, downloads and deletes.
+
+        Description
+        ===========
+        Every remote key used by 'ops' is listed up-front with one LIST
+        per parent directory. The listings are cached (see
+        _list_keys()) so the individual operations do not each need a
+        HEAD request to find the key's metadata. Keys in the root of
+        the bucket are not listed, as that would list the whole bucket,
+        and use a HEAD request instead.
+
+        Operations on different keys run concurrently on a pool of
+        'max_workers' threads. Operations on the same key run one after
+        the other in the order given, so a download which follows an
+        upload of the same file sees the uploaded version.
+
+        Parameters
+        ==========
+        ops: [list of (<string>, <string>, <string>, <string>)]
+            (operation, src_dir, dst_dir, filename) for each operation,
+            where operation is one of:
+                "upload": upload(src_dir, dst_dir, filename)
+                "download": download_file(src_dir, dst_dir, filename)
+                "delete": delete(src_dir, filename)
+
+        max_workers=16: <integer>
+            Maximum number of keys worked on at the same time.
+
+        Returns
+        =======
+        [list of <boolean> or <None>]
+        The result of each operation, in the same order as 'ops'.
+
+        Raises
+        ======
+        <ValueError>
+        If an operation is not one of those listed above.
+        """
+        # Group the operations by the key they act on, keeping order.
+        groups = {}
+        for index, (operation, src_dir, dst_dir, filename) in enumerate(ops):
+            if operation == "upload":
+                keyname = posix_filepath(dst_dir, filename)
+            elif operation in ("download", "delete"):
+                keyname = posix_filepath(src_dir, filename)
             else:
-                _print("WARN", "'{}' could not be deleted.".format(filepath))
+                raise ValueError("Unknown operation '{}'".format(operation))
+            groups.setdefault(keyname, []).append(index)
+
+        # List the directories of the keys of interest to prime the
+        # cache, skipping any directory already covered by a parent.
+        if self.connection_established:
+            prefixes = []
+            for prefix in sorted({keyname.rpartition("/")[0] + "/" for keyname in groups if "/" in keyname}):
+                if not prefixes or not prefix.startswith(prefixes[-1]):
+                    prefixes.append(prefix)
+            for prefix in prefixes:
+                for _ in self._list_keys(prefix):
+                    pass
+
+        results = [None] * len(ops)
+
+        def run_group(indexes):
+            for index in indexes:
+                operation, src_dir, dst_dir, filename = ops[index]
+                if operation == "upload":
+                    results[index] = self.upload(src_dir, dst_dir, filename)
+                elif operation == "download":
+                    results[index] = self.download_file(src_dir, dst_dir, filename)
+                else:
+                    results[index] = self.delete(src_dir, filename)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(run_group, indexes) for indexes in groups.values()]
+            for f in concurrent.futures.as_completed(futures):
+                f.result()
+
+        return results
 
 
 ########################################################################
-def _print(level, string):
-    if USE_LOGGER is True:
-        if level == "DEBUG":
-            debugLogger.debug(string)
-        elif level == "INFO":
-            debugLogger.info(string)
-        elif level == "WARN":
-            debugLogger.warn(string)
-        elif level == "ERROR":
-            debugLogger.error(string)
-        else:
-            debugLogger.debug("UNKNOWN LEVEL: " + string)
-    else:
-        print("{}: {}".format(level, string))
+def _get_client(access_key, secret_key, region=None, use_accelerate=False, timeout=None, shared=True):
+    """
+    Return the S3 client for a set of credentials.
+
+    Description
+    ===========
+    Creating a session and client loads and parses the S3 service
+    model, which is slow compared to a request. Clients are therefore
+    created once per access key, region and endpoint and then cached
+    at module level. Low-level boto3 clients (unlike resources) are
+    thread-safe, so every AWSS3 instance and thread using the same
+    settings shares one client and therefore one pool of open HTTPS
+    connections.
+
+    If two threads create the same client at once, both receive the
+    one which was cached first.
+
+    Parameters
+    ==========
+    access_key: <string>
+        AWS access key ID.
+
+    secret_key: <string>
+        AWS secret access key.
+
+    region=None: <string>
+        Region to send requests to. If None the default region of the
+        environment is used.
+
+    use_accelerate=False: <boolean>
+        Set True to use the S3 Transfer Acceleration endpoint.
+
+    timeout=None: <number>
+        Connect and read timeout in seconds. If None botocore's default
+        is used.
+
+    shared=True: <boolean>
+        Set False to create a new client which is not cached, for a
+        caller which will close it.
+
+    Returns
+    =======
+    <botocore.client.S3>
+    """
+    # An access key ID only ever has one secret key.
+    cache_key = (access_key, region, use_accelerate, timeout)
+    client = _CLIENT_CACHE.get(cache_key) if shared else None
+    if client is None:
+        session = boto3.session.Session(
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key
+        )
+        # Acceleration needs virtual-hosted addressing. Otherwise
+        # botocore's "auto" style is kept, which falls back to path-style
+        # for bucket names that aren't valid in a TLS hostname (e.g.
+        # names containing dots).
+        s3_config = {"use_accelerate_endpoint": use_accelerate}
+        if use_accelerate:
+            s3_config["addressing_style"] = "virtual"
+        config = CLIENT_CONFIG.merge(Config(s3=s3_config))
+        if timeout is not None:
+            config = config.merge(Config(connect_timeout=timeout, read_timeout=timeout))
+        client = session.client("s3", region_name=region, config=config)
+        if shared:
+            client = _CLIENT_CACHE.setdefault(cache_key, client)
+    return client
+
+
+def _get_bucket_region(access_key, secret_key, bucket):
+    """
+    Return the region of 'bucket'.
+
+    The region is looked up once per bucket and then cached at module
+    level. None is returned if the region cannot be looked up (for
+    example without the s3:GetBucketLocation permission), in which case
+    the default region of the environment should be used.
+    """
+    if bucket not in _BUCKET_REGIONS:
+        try:
+            response = _get_client(access_key, secret_key).get_bucket_location(Bucket=bucket)
+        except ClientError:
+            return None
+
+        # Buckets in us-east-1 have no location constraint and "EU" is
+        # a legacy name for eu-west-1.
+        region = response.get("LocationConstraint") or "us-east-1"
+        _BUCKET_REGIONS[bucket] = "eu-west-1" if region == "EU" else region
+    return _BUCKET_REGIONS[bucket]
+
+
+def _retry(operation, *args, **kwargs):
+    """
+    Call 'operation' and retry it if it fails with a transient error.
+
+    Description
+    ===========
+    S3 responds with 503 SlowDown (and occasionally 500) under burst
+    load and expects clients to back off before trying again. Each
+    attempt is separated by an exponentially increasing delay with
+    random jitter: 1-2s, 2-3s, 4-5s, ... The client already retries
+    individual requests (see CLIENT_CONFIG) so this covers whole
+    operations, such as managed transfers, which fail after that.
+
+    Parameters
+    ==========
+    operation: <callable>
+        The S3 operation to call.
+
+    *args, **kwargs:
+        Arguments to call 'operation' with.
+
+    Returns
+    =======
+    The result of 'operation'.
+
+    Raises
+    ======
+    The last error raised by 'operation' if it is not transient or
+    all RETRY_ATTEMPTS attempts failed.
+    """
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return operation(*args, **kwargs)
+        except (BotoCoreError, ClientError, S3UploadFailedError) as err:
+            if attempt == RETRY_ATTEMPTS - 1 or not _is_transient(err):
+                raise
+            time.sleep((2 ** attempt) + random.random())
+
+
+def _is_transient(err):
+    """
+    Return True if 'err' is worth retrying (throttling, server and
+    connection errors) and False otherwise.
+    """
+    # Managed uploads wrap the original error.
+    if isinstance(err, S3UploadFailedError):
+        return err.__context__ is not None and _is_transient(err.__context__)
+
+    if isinstance(err, ClientError):
+        code = err.response.get("Error", {}).get("Code")
+        status = err.response.get("ResponseMetadata", {}).get("HTTPStatusCode", 0)
+        return status >= 500 or code in ("SlowDown", "RequestTimeout", "Throttling")
+
+    return isinstance(err, (BotoConnectionError, HTTPClientError))
 
 
 #######################################################################
@@ -732,13 +1460,27 @@ def posix_filepath(*args):
     """
     path = os.path.join(*args)
 
-    return path.replace("\\", "/")
+    return _to_posix(path)
+
+
+# Only paths built on Windows can contain backslash separators, so
+# elsewhere _to_posix() returns paths unchanged instead of copying
+# them with str.replace().
+if os.sep == "\\":
+    def _to_posix(path):
+        """ Return 'path' with all backslashes replaced by '/'. """
+        return path.replace("\\", "/")
+else:
+    def _to_posix(path):
+        """ Return 'path' unchanged; it cannot contain separators other than '/'. """
+        return path
 
 
 import datetime as dt
 def create_local(filepath):
-    if not os.path.exists(filepath):
-        os.makedirs(os.path.dirname(filepath))
+    branch = os.path.dirname(filepath)
+    if branch:
+        os.makedirs(branch, exist_ok=True)
 
     with open(filepath, "w") as wf:
         wf.write("This is a test file written by:\n {}\n at {}".format(__file__, dt.datetime.now()))
@@ -753,6 +1495,13 @@ def delete_local(filepath):
 ########################################################################
 if __name__ == "__main__":
 
+    # Logger configuration (from dictionary)
+    from logger.logging_config import config
+    import logging.config
+    logging.config.dictConfig(config)
+    for name in ['urllib3', 's3transfer', 'boto3', 'botocore']:
+        logging.getLogger(name).setLevel(logging.CRITICAL)
+
     s3_client = AWSS3(S3_ACCESS_KEY, S3_SECRET_KEY, S3_BUCKET, verbose=True)
 
     TEST_FILE = "test.txt"
@@ -766,17 +1515,21 @@ if __name__ == "__main__":
 
 
     create_local(LOCAL_FILEPATH)                                        # Create local
-    s3_client.upload(LOCAL_DIRECTORY, S3_DIRECTORY, TEST_FILE)          # Upload
-    s3_client.download_file(S3_DIRECTORY, LOCAL_DIRECTORY, TEST_FILE)   # Download
-    s3_client.download_file(S3_DIRECTORY, LOCAL_DIRECTORY, TEST_FILE)   # Overwrite local
-    s3_client.upload(LOCAL_DIRECTORY, S3_DIRECTORY, TEST_FILE)          # Overwrite remote
+    s3_client.batch_op([
+        ("upload", LOCAL_DIRECTORY, S3_DIRECTORY, TEST_FILE),           # Upload
+        ("download", S3_DIRECTORY, LOCAL_DIRECTORY, TEST_FILE),         # Download
+        ("download", S3_DIRECTORY, LOCAL_DIRECTORY, TEST_FILE),         # Overwrite local
+        ("upload", LOCAL_DIRECTORY, S3_DIRECTORY, TEST_FILE),           # Overwrite remote
+    ])
 
     with open(LOCAL_FILEPATH, "a") as wf:                               # Modify local
         wf.write("Hello, my name is Waldo. Or is it Wally?")
 
-    s3_client.upload(LOCAL_DIRECTORY, S3_DIRECTORY, TEST_FILE)          # Upload modified
-    s3_client.download_file(S3_DIRECTORY, LOCAL_DIRECTORY, TEST_FILE)   # Download modified
-    s3_client.delete(S3_DIRECTORY, TEST_FILE)                           # Delete remote
+    s3_client.batch_op([
+        ("upload", LOCAL_DIRECTORY, S3_DIRECTORY, TEST_FILE),           # Upload modified
+        ("download", S3_DIRECTORY, LOCAL_DIRECTORY, TEST_FILE),         # Download modified
+        ("delete", S3_DIRECTORY, LOCAL_DIRECTORY, TEST_FILE),           # Delete remote
+    ])
     delete_local(LOCAL_FILEPATH)                                        # Delete local
 
     print("complete\n")
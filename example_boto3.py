@@ -21,7 +21,14 @@ Last Updated: 21 March 2020
 # Standard library imports
 import os
 import sys
+import mmap
+import time
+import shutil
+import hashlib
 import logging
+import itertools
+import concurrent.futures
+from functools import cached_property
 
 # Logger configuration (from dictionary)
 if __name__ == "__main__":
@@ -29,20 +36,25 @@ if __name__ == "__main__":
     import logging.config
     logging.config.dictConfig(config)
 
+    # Control which modules are allowed to the application log files.
+    # This will block all logs except Critical logs from the defined
+    # group. Modules importing this one keep their own logging setup.
+    for name in ['boto', 'urllib3', 's3transfer', 'boto3', 'botocore', 'nose']:
+        logging.getLogger(name).setLevel(logging.CRITICAL)
+
 # # Logger configuration (from file)
 # if __name__ == "__main__":
 #     import logging.config
 #     logger_config = "logging_{}.conf".format(os.name)
 #     logging.config.fileConfig(os.path.join(os.path.dirname(__file__), "logger", logger_config))
 
-# Control which modules are allowed to the application log files. This
-# will block all logs except Critical logs from the defined group.
-for name in ['boto', 'urllib3', 's3transfer', 'boto3', 'botocore', 'nose']:
-    logging.getLogger(name).setLevel(logging.CRITICAL)
 debugLogger = logging.getLogger(__name__)
 
 # Third-party library imports
 from boto3.session import Session
+from boto3.s3.transfer import TransferConfig
+from boto3.exceptions import S3UploadFailedError
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from botocore.exceptions import ProfileNotFound
 
@@ -54,14 +66,42 @@ dotenv.load_dotenv(os.path.join(os.path.dirname(__file__), ".env"))
 # # Collect details from .env file
 S3_BUCKET = os.environ["S3_BUCKET"]
 
+# Widen the connection pool beyond the default of 10 so concurrent
+# transfers (upload_files(), download_files() and the parts of each
+# large file) are not queued behind each other. Idle connections are
+# kept alive rather than re-opened with a new TLS handshake, and
+# throttled requests back off adaptively.
+CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Maximum number of keys S3 accepts in a single DeleteObjects request.
+DELETE_BATCH_SIZE = 1000
+
+# Object metadata from HEAD requests is reused for HEAD_TTL seconds. At
+# most HEAD_CACHE_SIZE objects are kept.
+HEAD_TTL = 2
+HEAD_CACHE_SIZE = 256
+
+# The S3 client created for each profile, shared by every S3Session
+# using that profile (see S3Session._connect()).
+_SESSION_CACHE = {}
+
 
 ########################################################################
 class S3Session(object):
     """
     Create an AWS S3 client.
+
+    Create one S3Session per bucket and reuse it. All requests go
+    through a single botocore client, which is thread-safe, so one
+    S3Session can be shared between threads and between tests.
     """
 
-    def __init__(self, bucket_name, profile_name=None):
+    def __init__(self, bucket_name, profile_name=None, multipart_chunksize=64*1024*1024, max_concurrency=16,
+                 warm=False):
         """ Initialise the S3Session object.
 
         Parameters
@@ -73,14 +113,42 @@ class S3Session(object):
             Name of the profile to use for account access. If None the
             default credentials will be used.
 
+        multipart_chunksize: <integer>
+            Size in bytes of each part of a file larger than 8 MiB when
+            it is uploaded or downloaded.
+
+        max_concurrency: <integer>
+            Maximum number of parts of one file transferred at the same
+            time.
+
+        warm: <boolean>
+            Set True to open a connection to the bucket straight away
+            (see warm()) rather than on the first request.
+
         """
         self.connect(bucket_name, profile_name)
-        self._initialise()
 
-        self.most_recent_object = None
+        self._transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=multipart_chunksize,
+            max_concurrency=max_concurrency,
+            use_threads=True,
+        )
+
+        self._head_cache = {}
+        self._checksums = {}
+
+        if warm is True:
+            self.warm()
 
     def connect(self, bucket_name, profile_name=None):
-        """ Start an S3 session.
+        """ Select the profile and bucket of the S3 session.
+
+        Description
+        ===========
+        No session is started here. The S3 client is only created the
+        first time 'self.client' is used (see _connect()), so creating
+        an S3Session is cheap and does not need network access.
 
         Parameters
         ==========
@@ -93,20 +161,76 @@ class S3Session(object):
 
         Returns
         =======
-        Nothing is returned, but the object variables 'self.s3',
-        'self.bucket' and 'self.bucket_name' will be updated.
+        Nothing is returned, but the object variables
+        'self.profile_name' and 'self.bucket_name' will be updated.
+        """
+        self.profile_name = profile_name
+        self.__dict__.pop("client", None)
+        self.set_bucket(bucket_name)
+
+    @cached_property
+    def client(self):
+        """ The S3 client of 'self.profile_name'. """
+        return self._connect()
+
+    def _connect(self):
+        """ Start an S3 session.
+
+        Description
+        ===========
+        Creating a session loads and parses the S3 service model, so the
+        client of each profile is cached and reused by later S3Session
+        objects, along with its connection pool. Only the low-level
+        client is used; its requests and responses are plain
+        dictionaries, without the per-call overhead of the resource
+        layer.
+
+        Returns
+        =======
+        <botocore.client.S3>
+        The S3 client of 'self.profile_name'.
         """
-        debugLogger.info("Using profile: {}".format("default" if profile_name is None else profile_name))
+        profile_name = self.profile_name
+        cached = _SESSION_CACHE.get(profile_name)
+        if cached is None:
+            debugLogger.info("Using profile: %s", "default" if profile_name is None else profile_name)
+            try:
+                session = Session(profile_name=profile_name)
+                debugLogger.info("  Session established.")
+            except ProfileNotFound as err:
+                debugLogger.error(err)
+                sys.exit(1)
 
+            cached = _SESSION_CACHE.setdefault(profile_name, session.client("s3", config=CLIENT_CONFIG))
+
+        return cached
+
+    def warm(self):
+        """
+        Open a connection to the bucket ahead of the first request.
+
+        Description
+        ===========
+        A HEAD request is made to the bucket so that the DNS lookup, TCP
+        connection and TLS handshake are done now. The connection stays
+        in the client's pool (kept alive, see CLIENT_CONFIG) so the
+        first real request does not pay for them. Errors are only
+        logged; they will surface again on the first real request.
+        """
         try:
-            session = Session(profile_name=profile_name)
-            debugLogger.info("  Session established.")
-        except ProfileNotFound as err:
-            debugLogger.error(err)
-            sys.exit(1)
+            self.client.head_bucket(Bucket=self.bucket_name)
+        except ClientError as err:
+            debugLogger.warning(err)
 
-        self.s3 = session.resource("s3")
-        self.set_bucket(bucket_name)
+    @classmethod
+    def close_all(cls):
+        """
+        Close the connections of every cached session and empty the
+        cache, so the next S3Session creates a new session.
+        """
+        while _SESSION_CACHE:
+            _, client = _SESSION_CACHE.popitem()
+            client.close()
 
     def set_bucket(self, bucket_name):
         """ Set which S3 bucket to access.
@@ -117,11 +241,10 @@ class S3Session(object):
             Name of the bucket to connect to.
 
         Returns:
-        Nothing is returned, but the object variables 'self.bucket' and
-        'self.bucket_name' will be updated.
+        Nothing is returned, but the object variable 'self.bucket_name'
+        will be updated.
         """
-        debugLogger.info("Accessing bucket: {}".format(bucket_name))
-        self.bucket = self.s3.Bucket(bucket_name)
+        debugLogger.info("Accessing bucket: %s", bucket_name)
         self.bucket_name = bucket_name
 
     def get_bucket_name(self):
@@ -135,25 +258,29 @@ class S3Session(object):
         """
         return self.bucket_name
 
-    def _initialise(self):
+    @staticmethod
+    def _s3_key(s3_directory, filename):
         """
-        Make a dud request to the bucket to initiliase the session.
+        Return the S3 key of 'filename' inside 's3_directory'.
+
+        S3 keys always use '/' as a separator, so 's3_directory' should
+        already be in posix format (see posix_filepath()). The key is
+        built by plain concatenation since it is needed for every
+        request.
         """
-        try:
-            self._key_exists("x", "y")
-        except ClientError as err:
-            debugLogger.error(err)
-            debugLogger.info("  Are you certain your access credentials are valid?")
-            sys.exit(1)
+        return s3_directory.rstrip("/") + "/" + filename if s3_directory else filename
 
-    def _get_object(self, s3_directory, filename, renew=True):
+    def _get_object(self, s3_directory, filename, renew=False):
         """
-        Retrieve an S3 Object.
+        Retrieve the metadata of an S3 Object.
 
         Description
         ===========
-        For more information about an S3 Object, see:
-        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#object
+        A single HEAD request is made and its response is kept for
+        HEAD_TTL seconds, so checking or reading several attributes of
+        the same object in quick succession does not make any further
+        requests. For more information, see:
+        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.head_object
 
         Parameters
         ==========
@@ -165,12 +292,14 @@ class S3Session(object):
 
         renew: <boolean>
             Set True to always request an object from S3. Set False to
-            only request an object if the key has changed from the
-            since the last _get_object() call.
+            reuse the result of a request made for the same object in
+            the last HEAD_TTL seconds.
 
         Returns
         =======
-        If file is found: <boto3.resources.factory.s3.Object>
+        If file is found: <dictionary>
+            The head_object() response, e.g. 'ContentLength', 'ETag'
+            and 'LastModified'.
 
         If file is not found: <None>
             This is only returned if an 404 error is recieved. Any other
@@ -181,35 +310,101 @@ class S3Session(object):
         If an error other than HTTP 404 is returned, an exception will
         be raised.
         """
-        s3_filepath = posix_filepath(s3_directory, filename)
+        return self._head_by_key(self._s3_key(s3_directory, filename), renew)
+
+    def _head_by_key(self, s3_filepath, renew=False):
+        """
+        Retrieve the metadata of the S3 Object with the key
+        's3_filepath'. See _get_object().
+        """
+        # Continue to use recent information about the object unless a
+        # renew was forced.
+        cached = self._head_cache.get((self.bucket_name, s3_filepath))
+        if renew is False and cached is not None and time.monotonic() - cached[0] < HEAD_TTL:
+            return cached[1]
 
-        # Only retrieve new object information if forced to do so or if
-        # the key has changed.
-        if renew is False:
-            if self.most_recent_object is not None:
-                renew = s3_filepath != self.most_recent_object.key
+        # Check if the object exists in S3.
+        try:
+            result = self.client.head_object(Bucket=self.bucket_name, Key=s3_filepath)
+        except ClientError as err:
+            # ClientError: Object not found
+            if err.response["Error"]["Code"] not in ("404", "NoSuchKey"):
+                raise
+            debugLogger.debug("File not found: %s", err)
+            result = None
 
-        if renew is True:
-            result = self.s3.Object(self.bucket_name, s3_filepath)
+        # Drop the oldest result to make room for this one.
+        if len(self._head_cache) >= HEAD_CACHE_SIZE:
+            oldest = min(list(self._head_cache.items()), key=lambda item: item[1][0])[0]
+            self._head_cache.pop(oldest, None)
+        self._head_cache[(self.bucket_name, s3_filepath)] = (time.monotonic(), result)
 
-            # Check if the object exists in S3.
-            try:
-                result.load()
-            except ClientError as err:
-                # ClientError: Object not found
-                if err.response["Error"]["Code"] != "404":
-                    raise
-                debugLogger.debug("File not found: {}".format(err))
-                result = None
+        return result
 
-            self.most_recent_object = result
+    def describe(self, s3_directory, filename, renew=False):
+        """
+        Return all of the metadata of an S3 Object.
 
-        else:
-            # Continue to use previous information because the key is
-            # the same as before and a force renew was not given.
-            result = self.most_recent_object
+        Description
+        ===========
+        The metadata comes from a single HEAD request (see
+        _get_object()), so reading several fields from the result costs
+        one round-trip instead of one get_*() call each.
 
-        return result
+        Parameters
+        ==========
+        s3_directory: <string>
+            Filepath to the directory in S3 where 'filename' is found.
+
+        filename: <string>
+            Name of the file of interest, including file extension.
+
+        renew: <boolean>
+            Set True to always submit a server request for the S3
+            Object. Set False to reuse the result of a request made for
+            the same object in the last HEAD_TTL seconds.
+
+        Returns
+        =======
+        If the file exists: <dictionary>
+            The head_object() response, e.g. 'ContentLength', 'ETag',
+            'ContentType' and 'LastModified'.
+        If the file doesn't exist: <None>
+        """
+        return self._get_object(s3_directory, filename, renew)
+
+    def describe_many(self, files, renew=False, max_workers=64):
+        """
+        Return all of the metadata of several S3 Objects.
+
+        Description
+        ===========
+        One HEAD request is made per object, as in describe(), but the
+        requests are made from a thread pool which shares this session's
+        client so their round-trips overlap. The results are kept for
+        later describe() and get_*() calls.
+
+        Parameters
+        ==========
+        files: <list> of <tuples>
+            A (s3_directory, filename) tuple for each object.
+
+        renew: <boolean>
+            See describe().
+
+        max_workers: <integer>
+            Maximum number of HEAD requests made at the same time. This
+            should not exceed the client's max_pool_connections (see
+            CLIENT_CONFIG).
+
+        Returns
+        =======
+        <list>
+        The describe() result for each entry of 'files', in the same
+        order.
+        """
+        calls = [(s3_directory, filename, renew) for s3_directory, filename in files]
+        return self._run_concurrently(self.describe, calls, max_workers)
 
     def _key_exists(self, s3_directory, filename):
         """
@@ -222,6 +417,58 @@ class S3Session(object):
         exists = self._get_object(s3_directory, filename) is not None
         return exists
 
+    def _etag_checksum(self, filepath):
+        """
+        Calculate the ETag S3 gives a file uploaded by upload_file().
+
+        Description
+        ===========
+        Files uploaded in a single part have an ETag equal to the MD5
+        checksum of their contents. Files large enough to be uploaded in
+        multiple parts (see 'self._transfer_config') have an ETag made
+        from the MD5 checksum of the concatenated MD5 digests of each
+        part, followed by '-' and the number of parts.
+
+        Checksums are cached against the file's size and modification
+        time, so an unchanged file is only read the first time.
+
+        Parameters
+        ==========
+        filepath: <string>
+            Filepath to the file on the local machine.
+
+        Returns
+        =======
+        <string>
+        The expected ETag of the file, without quotes.
+        """
+        stat = os.stat(filepath)
+        cached = self._checksums.get(filepath)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+
+        # An empty file can't be memory mapped.
+        if stat.st_size == 0:
+            etag = hashlib.md5().hexdigest()
+
+        else:
+            chunksize = self._transfer_config.multipart_chunksize
+            with open(filepath, "rb") as rf:
+                with mmap.mmap(rf.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # Slicing a memoryview hashes each part without copying it.
+                    with memoryview(mm) as view:
+                        if stat.st_size < self._transfer_config.multipart_threshold:
+                            etag = hashlib.md5(view).hexdigest()
+                        else:
+                            digests = [
+                                hashlib.md5(view[start:start+chunksize]).digest()
+                                for start in range(0, len(view), chunksize)
+                            ]
+                            etag = "{}-{}".format(hashlib.md5(b"".join(digests)).hexdigest(), len(digests))
+
+        self._checksums[filepath] = (stat.st_mtime_ns, stat.st_size, etag)
+        return etag
+
     #------------------------------------------------------------------
     def get_contents(self, s3_directory, include_subdirectories=True):
         """
@@ -243,24 +490,82 @@ class S3Session(object):
         <list> of <strings>
         A list of filepaths located inside 'self.bucket_name/s3_directory'
         """
+        prefix = self._dir_prefix(s3_directory)
+
         # Return all contents extending from 's3_directory'
-        root = posix_filepath(s3_directory)
-        contents = [s3_object.key for s3_object in self.bucket.objects.filter(Prefix=root)]
+        if include_subdirectories is True:
+            contents = [s3_object["Key"] for s3_object in self._list_objects(prefix)]
 
         # Return only contents found immediately in 's3_directory',
-        # including folder names.
-        if include_subdirectories is False:
-
-            root_items = []
-            for filepath in contents:
-                root_item = filepath.split("/")[1]
-                root_item_filepath = posix_filepath(root, root_item)
-                if root_item_filepath not in root_items:
-                    root_items.append(root_item_filepath)
-            contents = root_items
+        # including folder names. S3 groups everything below a folder
+        # into a single common prefix (e.g. 'root/folder/') so the
+        # sub-directories are never listed.
+        else:
+            contents = []
+            for page in self._paginate(prefix, delimiter="/"):
+                contents.extend(s3_object["Key"] for s3_object in page.get("Contents", []))
+                contents.extend(folder["Prefix"].rstrip("/") for folder in page.get("CommonPrefixes", []))
+            contents.sort()
 
         return contents
 
+    def iter_contents(self, s3_directory):
+        """
+        Iterate over the contents located inside the specified
+        directory, including files in sub-directories.
+
+        Description
+        ===========
+        Unlike get_contents(), filepaths are yielded as each page of
+        the listing arrives, so the caller can start working before the
+        whole directory has been listed and stopping early (e.g. from
+        any() or a 'break') saves the remaining requests.
+
+        Parameters
+        ==========
+        s3_directory: <string>
+            Path to the directory whose contents is of interest. This
+            should not include the bucket name.
+
+        Returns
+        =======
+        <generator> of <strings>
+        The filepaths located inside 'self.bucket_name/s3_directory',
+        in key order.
+        """
+        for s3_object in self._iter_objects(self._paginate(self._dir_prefix(s3_directory))):
+            yield s3_object["Key"]
+
+    def get_contents_with_metadata(self, s3_directory):
+        """
+        Retrieve the contents located inside the specified directory
+        together with their size and ETag.
+
+        Description
+        ===========
+        The size and ETag of every object are included in the LIST
+        response, so this avoids the HEAD request per object made by
+        calling get_size() or get_etag() for each item returned by
+        get_contents().
+
+        Parameters
+        ==========
+        s3_directory: <string>
+            Path to the directory whose contents is of interest. This
+            should not include the bucket name.
+
+        Returns
+        =======
+        <list> of <tuples>
+        A (filepath, size in bytes, ETag) tuple for each file located
+        inside 'self.bucket_name/s3_directory', including files in
+        sub-directories.
+        """
+        return [
+            (s3_object["Key"], s3_object["Size"], s3_object["ETag"])
+            for s3_object in self._list_objects(self._dir_prefix(s3_directory))
+        ]
+
     def get_all_contents(self):
         """
         Retrieve all contents inside the bucket.
@@ -270,18 +575,96 @@ class S3Session(object):
         <list> of <strings>
         A list of filenames located inside `self.bucket_name`.
         """
-        contents = [s3_object.key for s3_object in self.bucket.objects.all()]
+        contents = [s3_object["Key"] for s3_object in self._list_objects("")]
         return contents
 
+    def _list_objects(self, prefix, max_workers=16):
+        """
+        List every object whose key starts with 'prefix'.
+
+        Description
+        ===========
+        The pages of a single listing can only be requested one after
+        the other, because each page holds the token for the next. The
+        listing is therefore split by folder: the objects and folders
+        immediately under 'prefix' are listed first, then each folder is
+        listed on its own thread, so the page round-trips of separate
+        folders overlap.
+
+        Parameters
+        ==========
+        prefix: <string>
+            Start of the keys to list. Use "" for the whole bucket.
+
+        max_workers: <integer>
+            Maximum number of folders to list at the same time.
+
+        Returns
+        =======
+        <list> of <dictionaries>
+        The ListObjectsV2 description ('Key', 'Size', 'ETag', ...) of
+        each object, in key order.
+        """
+        objects = []
+        folders = []
+        for page in self._paginate(prefix, delimiter="/"):
+            objects.extend(page.get("Contents", []))
+            folders.extend(folder["Prefix"] for folder in page.get("CommonPrefixes", []))
+
+        def list_folder(folder):
+            return list(self._iter_objects(self._paginate(folder)))
+
+        if folders:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for folder_objects in executor.map(list_folder, folders):
+                    objects.extend(folder_objects)
+
+        objects.sort(key=lambda s3_object: s3_object["Key"])
+        return objects
+
+    @staticmethod
+    def _dir_prefix(s3_directory):
+        """
+        Return the prefix of the keys inside 's3_directory', ending in
+        '/' so that _list_objects() splits the listing at the folders
+        inside 's3_directory' rather than at 's3_directory' itself.
+        """
+        root = posix_filepath(s3_directory)
+        return root.rstrip("/") + "/" if root else root
+
+    def _paginate(self, prefix, delimiter=None):
+        """
+        Return an iterator over the pages of a ListObjectsV2 listing of
+        all keys starting with 'prefix'.
+
+        S3 returns at most 1000 keys per page. If 'delimiter' is given,
+        keys containing it after 'prefix' are grouped into
+        'CommonPrefixes' instead of being listed individually.
+        """
+        paginator = self.client.get_paginator("list_objects_v2")
+        kwargs = {"Bucket": self.bucket_name, "Prefix": prefix}
+        if delimiter is not None:
+            kwargs["Delimiter"] = delimiter
+        return paginator.paginate(**kwargs)
+
+    @staticmethod
+    def _iter_objects(pages):
+        """
+        Return an iterator over the objects ('Contents') of all 'pages'.
+        """
+        return itertools.chain.from_iterable(page.get("Contents", []) for page in pages)
+
     #------------------------------------------------------------------
-    def upload_file(self, src_directory, s3_directory, filename):
+    def upload_file(self, src_directory, s3_directory, filename, skip_unchanged=True):
         """
         Upload 'src_directory/filename' to 's3_directory/filename'.
 
         The s3 file will be overwritten if it already exists in the
-        destination location ('s3_directory').
+        destination location ('s3_directory'), unless it is identical
+        to the local file and 'skip_unchanged' is True, in which case
+        nothing is uploaded.
 
-        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Object.upload_file
+        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.upload_file
 
         Parameters
         ==========
@@ -296,35 +679,101 @@ class S3Session(object):
         filename: <string>
             Name of the file of interest, including file extension.
 
+        skip_unchanged: <boolean>
+            Set True to check S3 for an identical file before uploading.
+            Set False to upload straight away, which saves a HEAD
+            request when the file is known to have changed.
+
         Returns
         =======
-        File exists locally, Upload successful: <boolean> True
+        File exists locally, Upload successful: <dictionary>
+            The 'ETag' and 'VersionId' of the uploaded S3 Object, so the
+            upload can be checked without another HEAD request. Also
+            returned if the file in S3 is already up-to-date. Both are
+            None if a multipart upload succeeded but its ETag could not
+            be looked up.
 
         File exists locally, Upload failed: <boolean> False
             # TODO: (AHA) HOW IS THIS SITUATION HANDLED?
 
         File does not exist locally: <None>
         """
-        # Create a filepath from the source directory and filename.
+        # Create filepaths from the directories and filename.
         src_filepath = posix_filepath(src_directory, filename)
+        s3_filepath = self._s3_key(s3_directory, filename)
 
-        # If the file exists in S3
-        if os.path.exists(src_filepath) is True:
+        return self.upload_by_key(src_filepath, s3_filepath, skip_unchanged)
 
-            # Create a filepath from the destination directory and filename.
-            s3_filepath = posix_filepath(s3_directory, filename)
-            s3_object = self.s3.Object(self.bucket_name, s3_filepath)
+    def upload_by_key(self, src_filepath, s3_filepath, skip_unchanged=True):
+        """
+        Upload the local file 'src_filepath' to the S3 key
+        's3_filepath'. See upload_file().
+
+        Parameters
+        ==========
+        src_filepath: <string>
+            Filepath of the file on the local machine.
+
+        s3_filepath: <string>
+            Key the file will be uploaded to, e.g. as returned by
+            _s3_key().
+
+        skip_unchanged: <boolean>
+            See upload_file().
+
+        Returns
+        =======
+        See upload_file().
+        """
+        # If the file exists locally
+        if os.path.isfile(src_filepath) is True:
+
+            # Skip the upload if S3 already holds the same file. A change
+            # in size means the file was modified, which saves reading
+            # the whole local file to checksum it.
+            s3_object = self._head_by_key(s3_filepath) if skip_unchanged is True else None
+            unchanged = (
+                s3_object is not None
+                and s3_object["ContentLength"] == os.path.getsize(src_filepath)
+                and s3_object["ETag"].strip('"') == self._etag_checksum(src_filepath)
+            )
+
+            if unchanged is True:
+                debugLogger.debug("File is up-to-date: %s", s3_filepath)
+                response = s3_object
 
             # Upload the target file to S3.
-            try:
-                s3_object.upload_file(src_filepath)
-            except ClientError as err:
-                debugLogger.warning(err)
-                result = False
             else:
-                result = True
+                # The metadata kept by _get_object() is now out of date.
+                self._head_cache.pop((self.bucket_name, s3_filepath), None)
+
+                try:
+                    # A single PUT returns the ETag of the new object.
+                    if os.path.getsize(src_filepath) < self._transfer_config.multipart_threshold:
+                        with open(src_filepath, "rb") as body:
+                            response = self.client.put_object(Bucket=self.bucket_name, Key=s3_filepath, Body=body)
+                    else:
+                        self.client.upload_file(src_filepath, self.bucket_name, s3_filepath, Config=self._transfer_config)
+                        response = {}
+                except (ClientError, S3UploadFailedError):
+                    debugLogger.exception("Upload file failed: %s", s3_filepath)
+                    response = None
+
+                # A multipart upload returns no ETag, so it is looked up
+                # afterwards. The HEAD costs little next to the transfer
+                # itself, and the upload still succeeded if it fails.
+                if response == {}:
+                    try:
+                        response = self._head_by_key(s3_filepath, renew=True) or {}
+                    except ClientError:
+                        debugLogger.warning("Could not look up the ETag of %s", s3_filepath, exc_info=True)
+
+            if response is not None:
+                result = {"ETag": response.get("ETag"), "VersionId": response.get("VersionId")}
+            else:
+                result = False
 
-        # If the file doesn't exist in S3
+        # If the file doesn't exist locally
         else:
             result = None
 
@@ -338,7 +787,7 @@ class S3Session(object):
         does not already exist. If 'filename' already exists in this
         location it will be overwritten.
 
-        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Object.download_file
+        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.download_file
 
         Parameters
         ==========
@@ -362,34 +811,70 @@ class S3Session(object):
 
         File does not exist in S3: <None>
         """
-        s3_object = self._get_object(s3_directory, filename)
+        # Create filepaths from the directories and filename.
+        s3_filepath = self._s3_key(s3_directory, filename)
+        dst_filepath = posix_filepath(dst_directory, filename)
 
-        # If the file exists in S3
-        if s3_object is not None:
+        return self.download_by_key(s3_filepath, dst_filepath)
+
+    def download_by_key(self, s3_filepath, dst_filepath):
+        """
+        Download the S3 key 's3_filepath' to the local file
+        'dst_filepath'. See download_file().
+
+        Parameters
+        ==========
+        s3_filepath: <string>
+            Key of the file in S3, e.g. as returned by _s3_key().
+
+        dst_filepath: <string>
+            Filepath on the local machine where the file should be
+            saved to.
 
-            # Create a filepath from the source directory and filename.
-            dst_filepath = posix_filepath(dst_directory, filename)
+        Returns
+        =======
+        See download_file().
+        """
+        s3_object = self._head_by_key(s3_filepath)
 
-            # If the file already exists copy the existing file contents
-            # for data recovery.
-            if os.path.exists(dst_filepath) is True:
-                with open(dst_filepath, "rb") as rf:
-                    backup_data = rf.read()
+        # If the file exists in S3
+        if s3_object is not None:
 
-            # Create the destination filepath if it doesn't exist
-            elif os.path.exists(dst_directory) is not True:
-                os.makedirs(dst_directory)
+            # Create the destination filepath if it doesn't exist. Other
+            # threads may be creating the same directory at the same time.
+            dst_directory = os.path.dirname(dst_filepath)
+            if dst_directory:
+                os.makedirs(dst_directory, exist_ok=True)
 
-            # Download the target file.
+            # Download the target file to a temporary file which only
+            # replaces the destination once it is complete. An existing
+            # file is therefore left untouched if the download fails.
+            tmp_filepath = dst_filepath + ".part"
             try:
-                s3_object.download_file(dst_filepath)
-            except ClientError as err:
+                if s3_object["ContentLength"] > self._transfer_config.multipart_chunksize:
+                    self._download_parallel(
+                        s3_filepath, tmp_filepath, s3_object["ContentLength"], s3_object["ETag"],
+                        self._transfer_config.multipart_chunksize, self._transfer_config.max_concurrency,
+                    )
+                else:
+                    # 'IfMatch' fails the download if the object was
+                    # replaced since the HEAD, so the allocated size is
+                    # always the size of the object received.
+                    response = self.client.get_object(
+                        Bucket=self.bucket_name, Key=s3_filepath, IfMatch=s3_object["ETag"],
+                    )
+                    with open(tmp_filepath, "wb") as wf:
+                        self._allocate(wf, s3_object["ContentLength"])
+                        shutil.copyfileobj(response["Body"], wf, 1024 * 1024)
+                os.replace(tmp_filepath, dst_filepath)
+            except ClientError:
                 result = False
-                debugLogger.warning(err)
-                with open(dst_filepath, "wb") as wf:
-                    wf.write(backup_data)
+                debugLogger.exception("Download file failed: %s", s3_filepath)
             else:
                 result = True
+            finally:
+                if os.path.exists(tmp_filepath) is True:
+                    os.remove(tmp_filepath)
 
         # If the file doesn't exist in S3
         else:
@@ -397,6 +882,149 @@ class S3Session(object):
 
         return result
 
+    def _download_parallel(self, s3_filepath, dst_filepath, size, etag, part_size=64 * 1024 * 1024, max_workers=16):
+        """
+        Download a large S3 Object using concurrent ranged GET requests.
+
+        Description
+        ===========
+        'dst_filepath' is allocated at its full size up front and each
+        part of the object is written straight to its own offset in the
+        file, so the parts can arrive in any order.
+
+        Parameters
+        ==========
+        s3_filepath: <string>
+            Key of the S3 Object to download.
+
+        dst_filepath: <string>
+            Filepath on the local machine to write the object to.
+
+        size: <integer>
+            Size of the S3 Object in bytes.
+
+        etag: <string>
+            ETag of the S3 Object. Every part is requested with
+            'IfMatch' so a download fails, rather than mixing parts,
+            if the object is overwritten part way through.
+
+        part_size: <integer>
+            Number of bytes requested by each GET.
+
+        max_workers: <integer>
+            Maximum number of parts to download at the same time.
+
+        Raises
+        ======
+        Any error returned by a GET request is raised.
+        """
+        with open(dst_filepath, "wb") as wf:
+            self._allocate(wf, size)
+
+        def download_part(start):
+            end = min(start + part_size, size) - 1
+            response = self.client.get_object(
+                Bucket=self.bucket_name, Key=s3_filepath, IfMatch=etag,
+                Range="bytes={}-{}".format(start, end),
+            )
+            with open(dst_filepath, "r+b") as wf:
+                wf.seek(start)
+                shutil.copyfileobj(response["Body"], wf, 1024 * 1024)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(download_part, start) for start in range(0, size, part_size)]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+
+    @staticmethod
+    def _allocate(fileobj, size):
+        """
+        Reserve 'size' bytes of disk space for the open file 'fileobj'.
+
+        Where os.posix_fallocate() is available the filesystem reserves
+        the space up front, so data written at any offset lands in
+        contiguous extents. Elsewhere the file is only extended to
+        'size'.
+        """
+        if size == 0:
+            return
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fileobj.fileno(), 0, size)
+        else:
+            fileobj.truncate(size)
+
+    def upload_files(self, files, max_workers=25):
+        """
+        Upload several files concurrently.
+
+        Description
+        ===========
+        Each file is uploaded with upload_file() on a thread pool which
+        shares this session's client, so the round-trips of separate
+        files overlap instead of running one after the other.
+
+        Parameters
+        ==========
+        files: <list> of <tuples>
+            A (src_directory, s3_directory, filename) or
+            (src_directory, s3_directory, filename, skip_unchanged)
+            tuple for each file, as would be passed to upload_file().
+
+        max_workers: <integer>
+            Maximum number of files to upload at the same time.
+
+        Returns
+        =======
+        <list>
+        The upload_file() result for each entry of 'files', in the same
+        order.
+        """
+        return self._run_concurrently(self.upload_file, files, max_workers)
+
+    def download_files(self, files, max_workers=25):
+        """
+        Download several files concurrently.
+
+        Description
+        ===========
+        Each file is downloaded with download_file() on a thread pool
+        which shares this session's client, so the round-trips of
+        separate files overlap instead of running one after the other.
+
+        Parameters
+        ==========
+        files: <list> of <tuples>
+            A (s3_directory, dst_directory, filename) tuple for each
+            file, as would be passed to download_file().
+
+        max_workers: <integer>
+            Maximum number of files to download at the same time.
+
+        Returns
+        =======
+        <list>
+        The download_file() result for each entry of 'files', in the
+        same order.
+        """
+        return self._run_concurrently(self.download_file, files, max_workers)
+
+    @staticmethod
+    def _run_concurrently(method, calls, max_workers):
+        """
+        Call 'method' once with each tuple of arguments in 'calls' on a
+        thread pool and return the results in the order of 'calls'.
+        """
+        results = [None] * len(calls)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(method, *args): i for i, args in enumerate(calls)}
+
+            # Collect each result as soon as it is ready so a slow
+            # transfer does not hold up the reporting of the others.
+            for future in concurrent.futures.as_completed(futures):
+                results[futures[future]] = future.result()
+
+        return results
+
     def delete_file(self, s3_directory, filename):
         """
         Delete the file at 's3_directory/filename'.
@@ -406,7 +1034,11 @@ class S3Session(object):
         functionality behaves a little differently and this method
         may not return accurate information.
 
-        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Object.delete
+        The delete is requested straight away. S3 reports deleting a
+        file which does not exist as successful, so nothing is gained
+        by checking that it exists first.
+
+        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.delete_object
 
         Parameters
         ==========
@@ -418,60 +1050,220 @@ class S3Session(object):
 
         Returns
         =======
-        File exists in S3, Delete successful: <boolean> True
+        File no longer in S3, Delete successful: <boolean> True
 
-        File exists in S3, Delete failed: <boolean> False
+        Delete failed: <boolean> False
             # TODO: (AHA) HOW IS THIS SITUATION HANDLED?
+        """
+        return self.delete_by_key(self._s3_key(s3_directory, filename))
 
-        File does not exist in S3: <None>
+    def delete_by_key(self, s3_filepath):
         """
-        s3_object = self._get_object(s3_directory, filename)
+        Delete the S3 key 's3_filepath'. See delete_file().
 
-        # If the file exists in S3
-        if s3_object is not None:
+        Parameters
+        ==========
+        s3_filepath: <string>
+            Key of the file in S3, e.g. as returned by _s3_key().
 
-            # Delete the target file.
-            try:
-                response = s3_object.delete()
-            except ClientError as err:
-                debugLogger.warning(err)
-                result = False
-            else:
-                result = True
+        Returns
+        =======
+        See delete_file().
+        """
+        # Delete the target file.
+        try:
+            self.client.delete_object(Bucket=self.bucket_name, Key=s3_filepath)
+        except ClientError:
+            debugLogger.exception("Delete file failed: %s", s3_filepath)
+            result = False
+        else:
+            result = True
 
-        # If the file doesn't exist in S3
+        # The metadata kept by _get_object() is now out of date.
+        self._head_cache.pop((self.bucket_name, s3_filepath), None)
+
+        return result
+
+    def delete_files(self, files):
+        """
+        Delete several files using as few requests as possible.
+
+        Description
+        ===========
+        Files are deleted with DeleteObjects requests of up to
+        DELETE_BATCH_SIZE keys each, rather than one request per file.
+        Deleting a file which does not exist is reported as successful
+        by S3.
+
+        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.delete_objects
+
+        Parameters
+        ==========
+        files: <list> of <tuples>
+            A (s3_directory, filename) tuple for each file.
+
+        Returns
+        =======
+        <list> of <booleans>
+        Whether each entry of 'files' was deleted, in the same order.
+        """
+        s3_filepaths = [self._s3_key(s3_directory, filename) for s3_directory, filename in files]
+        failed = set()
+
+        for start in range(0, len(s3_filepaths), DELETE_BATCH_SIZE):
+            failed.update(self._delete_batch(s3_filepaths[start:start+DELETE_BATCH_SIZE]))
+
+        return [key not in failed for key in s3_filepaths]
+
+    def delete_directory(self, s3_directory, max_workers=4):
+        """
+        Delete every file inside 's3_directory', including files in
+        sub-directories.
+
+        Description
+        ===========
+        Each page of the directory listing (up to 1000 keys) is deleted
+        with a single DeleteObjects request on a thread pool, while the
+        next page is being listed, so listing and deleting overlap.
+
+        Parameters
+        ==========
+        s3_directory: <string>
+            Path to the directory to delete. This should not include the
+            bucket name. Only keys inside this directory are deleted,
+            e.g. 'test-dir' does not delete 'test-dir2/test.txt'.
+
+        max_workers: <integer>
+            Maximum number of DeleteObjects requests made at the same
+            time.
+
+        Returns
+        =======
+        <boolean>
+        True if every file was deleted, else False.
+        """
+        prefix = posix_filepath(s3_directory).rstrip("/") + "/"
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._delete_batch, [s3_object["Key"] for s3_object in page["Contents"]])
+                for page in self._paginate(prefix) if page.get("Contents")
+            ]
+            failed = sum(len(future.result()) for future in concurrent.futures.as_completed(futures))
+
+        return failed == 0
+
+    def _delete_batch(self, keys):
+        """
+        Delete up to DELETE_BATCH_SIZE 'keys' with a single DeleteObjects
+        request and return a <set> of the keys which were not deleted.
+        """
+        failed = set()
+        try:
+            response = self.client.delete_objects(
+                Bucket=self.bucket_name,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
+        except ClientError:
+            debugLogger.exception("Delete files failed: %d keys", len(keys))
+            failed.update(keys)
         else:
-            result = None
+            # In quiet mode only the keys which failed are listed.
+            for error in response.get("Errors", []):
+                debugLogger.error("Delete file failed: %s: %s", error["Key"], error.get("Message"))
+                failed.add(error["Key"])
+
+        # The metadata kept by _get_object() is now out of date.
+        for key in keys:
+            self._head_cache.pop((self.bucket_name, key), None)
+
+        return failed
+
+    def move_file(self, src_s3_directory, dst_s3_directory, filename):
+        """
+        Move 'src_s3_directory/filename' to 'dst_s3_directory/filename'.
+
+        Description
+        ===========
+        The file is copied inside S3 and then the original is deleted,
+        so none of its data passes through the local machine. Files
+        larger than the multipart threshold are copied in parts, several
+        at a time, which is also how files larger than the 5 GiB limit
+        of a single copy are handled.
+
+        https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3.html#S3.Client.copy
+
+        Parameters
+        ==========
+        src_s3_directory: <string>
+            Filepath to the directory in S3 where 'filename' is found.
+
+        dst_s3_directory: <string>
+            Filepath to the directory in S3 where 'filename' will be
+            moved to.
+
+        filename: <string>
+            Name of the file of interest, including file extension.
+
+        Returns
+        =======
+        File exists in S3, Move successful: <boolean> True
+
+        File exists in S3, Move failed: <boolean> False
+            The original file is only deleted once it has been copied.
+
+        File does not exist in S3: <None>
+        """
+        src_filepath = self._s3_key(src_s3_directory, filename)
+        dst_filepath = self._s3_key(dst_s3_directory, filename)
+
+        # Copy the target file inside S3.
+        try:
+            self.client.copy(
+                {"Bucket": self.bucket_name, "Key": src_filepath}, self.bucket_name, dst_filepath,
+                Config=self._transfer_config,
+            )
+        except ClientError as err:
+            if err.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                result = None
+            else:
+                debugLogger.exception("Move file failed: %s", src_filepath)
+                result = False
+        else:
+            result = self.delete_file(src_s3_directory, filename)
+
+        # The metadata kept by _get_object() is now out of date.
+        self._head_cache.pop((self.bucket_name, dst_filepath), None)
 
         return result
 
     #------------------------------------------------------------------
-    def get_attribute(self, attribute, s3_directory, filename, renew=True):
+    def get_attribute(self, attribute, s3_directory, filename, renew=False):
 
         s3_object = self._get_object(s3_directory, filename, renew)
 
         if s3_object is not None:
 
             if attribute == "content_length":
-                result = s3_object.content_length
+                result = s3_object["ContentLength"]
 
             elif attribute == "content_type":
-                result = s3_object.content_type
+                result = s3_object.get("ContentType")
 
             elif attribute == "e_tag":
-                result = s3_object.e_tag
+                result = s3_object["ETag"]
 
             elif attribute == "expiration":
-                result = s3_object.expiration
+                result = s3_object.get("Expiration")
 
             elif attribute == "expires":
-                result = s3_object.expires
+                result = s3_object.get("Expires")
 
             elif attribute == "last_modified":
-                result = s3_object.last_modified
+                result = s3_object["LastModified"]
 
             elif attribute == "version_id":
-                result = s3_object.version_id
+                result = s3_object.get("VersionId")
 
             else:
                 result = None
@@ -481,14 +1273,14 @@ class S3Session(object):
 
         return result
 
-    def get_size(self, s3_directory, filename, renew=True):
+    def get_size(self, s3_directory, filename, renew=False):
         """
         Return the size in bytes of an S3 Object.
 
         Description
         ===========
-        Retrieve an S3 Object and return the result of the
-        content_length method.
+        Retrieve the metadata of an S3 Object and return its
+        'ContentLength'.
 
         Parameters
         ==========
@@ -500,8 +1292,8 @@ class S3Session(object):
 
         renew: <boolean>
             Set True to always submit a server request for the S3
-            Object. Set False to only request an object if the key has
-            changed from the since the last _get_object() call.
+            Object. Set False to reuse the result of a request made for
+            the same object in the last HEAD_TTL seconds.
 
         Returns
         =======
@@ -512,13 +1304,13 @@ class S3Session(object):
         size_in_bytes = self.get_attribute("content_length", s3_directory, filename, renew)
         return size_in_bytes
 
-    def get_etag(self, s3_directory, filename, renew=True):
+    def get_etag(self, s3_directory, filename, renew=False):
         """
         Return the ETag (entity tag) of an S3 Object.
 
         Description
         ===========
-        Retrieve an S3 Object and return the result of the e_tag method.
+        Retrieve the metadata of an S3 Object and return its 'ETag'.
         The returned result will be an MD5 checksum for all files which
         were uploaded in a single part.
 
@@ -532,8 +1324,8 @@ class S3Session(object):
 
         renew: <boolean>
             Set True to always submit a server request for the S3
-            Object. Set False to only request an object if the key has
-            changed from the since the last _get_object() call.
+            Object. Set False to reuse the result of a request made for
+            the same object in the last HEAD_TTL seconds.
 
         Returns
         =======
@@ -545,7 +1337,7 @@ class S3Session(object):
         etag = self.get_attribute("e_tag", s3_directory, filename, renew)
         return etag
 
-    def get_content_type(self, s3_directory, filename, renew=True):
+    def get_content_type(self, s3_directory, filename, renew=False):
         """
         Return the MIME type of the S3 Object.
 
@@ -559,8 +1351,8 @@ class S3Session(object):
 
         renew: <boolean>
             Set True to always submit a server request for the S3
-            Object. Set False to only request an object if the key has
-            changed from the since the last _get_object() call.
+            Object. Set False to reuse the result of a request made for
+            the same object in the last HEAD_TTL seconds.
 
         Returns
         =======
@@ -572,7 +1364,7 @@ class S3Session(object):
         content_type = self.get_attribute("content_type", s3_directory, filename, renew)
         return content_type
 
-    def get_version(self, s3_directory, filename, renew=True):
+    def get_version(self, s3_directory, filename, renew=False):
         """
         Return the version of the S3 Object.
 
@@ -586,8 +1378,8 @@ class S3Session(object):
 
         renew: <boolean>
             Set True to always submit a server request for the S3
-            Object. Set False to only request an object if the key has
-            changed from the since the last _get_object() call.
+            Object. Set False to reuse the result of a request made for
+            the same object in the last HEAD_TTL seconds.
 
         Returns
         =======
@@ -600,7 +1392,7 @@ class S3Session(object):
         version_id = self.get_attribute("version_id", s3_directory, filename, renew)
         return version_id
 
-    def get_expiration(self, s3_directory, filename, renew=True):
+    def get_expiration(self, s3_directory, filename, renew=False):
         """
         Return the expiration information of an S3 Object.
 
@@ -621,8 +1413,8 @@ class S3Session(object):
 
         renew: <boolean>
             Set True to always submit a server request for the S3
-            Object. Set False to only request an object if the key has
-            changed from the since the last _get_object() call.
+            Object. Set False to reuse the result of a request made for
+            the same object in the last HEAD_TTL seconds.
 
         Returns
         =======
@@ -634,7 +1426,7 @@ class S3Session(object):
         expiration_data = self.get_attribute("expiration", s3_directory, filename, renew)
         return expiration_data
 
-    def get_expiry_date(self, s3_directory, filename, renew=True):
+    def get_expiry_date(self, s3_directory, filename, renew=False):
         """
         Return the date and time when the S3 Object will expire.
 
@@ -648,8 +1440,8 @@ class S3Session(object):
 
         renew: <boolean>
             Set True to always submit a server request for the S3
-            Object. Set False to only request an object if the key has
-            changed from the since the last _get_object() call.
+            Object. Set False to reuse the result of a request made for
+            the same object in the last HEAD_TTL seconds.
 
         Returns
         =======
@@ -661,7 +1453,7 @@ class S3Session(object):
         expiry_date = self.get_attribute("expires", s3_directory, filename, renew)
         return expiry_date
 
-    def get_modified_date(self, s3_directory, filename, renew=True):
+    def get_modified_date(self, s3_directory, filename, renew=False):
         """
         Return the date and time when the S3 Object was last modified.
 
@@ -675,8 +1467,8 @@ class S3Session(object):
 
         renew: <boolean>
             Set True to always submit a server request for the S3
-            Object. Set False to only request an object if the key has
-            changed from the since the last _get_object() call.
+            Object. Set False to reuse the result of a request made for
+            the same object in the last HEAD_TTL seconds.
 
         Returns
         =======
@@ -709,7 +1501,20 @@ def posix_filepath(*args):
     """
     path = os.path.join(*args)
 
-    return path.replace("\\", "/")
+    return _to_posix(path)
+
+
+# Only paths built on Windows can contain backslash separators, so
+# elsewhere _to_posix() returns paths unchanged instead of copying
+# them with str.replace().
+if os.sep == "\\":
+    def _to_posix(path):
+        """ Return 'path' with all backslashes replaced by '/'. """
+        return path.replace("\\", "/")
+else:
+    def _to_posix(path):
+        """ Return 'path' unchanged; it cannot contain separators other than '/'. """
+        return path
 
 
 ########################################################################
@@ -725,7 +1530,7 @@ if __name__ == "__main__":
     print("Remote: {}\n".format(S3_FILEPATH))
 
     # Create an Amazon Web Services S3 Client
-    s3_client = S3Session(S3_BUCKET)
+    s3_client = S3Session(S3_BUCKET, warm=True)
 
     # Run some basic tests on the code.
     from tests import BadlyWrittenTestClass
@@ -735,4 +1540,6 @@ if __name__ == "__main__":
     Tester.test_noLocal_yesRemote()
     Tester.test_yesLocal_yesRemote()
     Tester.test_objectAttributeDump()
+    Tester.test_stubbedDownload()
+    Tester.test_stubbedListing()
     print("")
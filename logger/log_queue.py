@@ -0,0 +1,13 @@
+#!python3
+
+"""
+Queue connecting the QueueHandler on the root logger to the
+QueueListener which writes records to the log files.
+"""
+
+# Standard Library Imports
+import queue
+
+
+########################################################################
+LOG_QUEUE = queue.Queue(-1)
@@ -7,7 +7,12 @@ Dictionary schema for logging.config
 # Standard Library Imports
 import os
 import sys
+import atexit
 import logging
+import logging.handlers
+
+# Local Imports
+from logger.log_queue import LOG_QUEUE
 
 
 ########################################################################
@@ -24,15 +29,37 @@ if not os.path.exists(PATH):
     os.makedirs(PATH)
 
 
+########################################################################
+# The log files are written by a QueueListener on its own thread, so
+# the threads doing the logging only put records on LOG_QUEUE instead
+# of waiting on disk I/O.
+def _file_handler(filename, level):
+    handler = logging.handlers.RotatingFileHandler(
+        os.path.join(PATH, filename), mode="a", maxBytes=10*1024*1024, backupCount=3
+    )
+    handler.setLevel(level)
+    handler.setFormatter(logging.Formatter(
+        "%(asctime)s | %(thread)6d | %(levelname)8s | %(name)s.%(funcName)s: %(message)s",
+        "%Y-%m-%d %H:%M:%S"
+    ))
+    return handler
+
+listener = logging.handlers.QueueListener(
+    LOG_QUEUE,
+    _file_handler("debug.log", logging.DEBUG),
+    _file_handler("console.log", logging.INFO),
+    _file_handler("error.log", logging.ERROR),
+    respect_handler_level=True
+)
+listener.start()
+atexit.register(listener.stop)
+
+
 ########################################################################
 config = {
     "version": 1,
 
     "formatters": {
-        "fileFormatter": {
-            "format": "%(asctime)s | %(thread)6d | %(levelname)8s | %(name)s.%(funcName)s: %(message)s",
-            "datefmt": "%Y-%m-%d %H:%M:%S"
-        },
         "streamFormatter": {
             "format": "%(asctime)s | %(levelname)7s: %(message)s",
             "datefmt": "%Y-%m-%d %H:%M:%S"
@@ -40,32 +67,10 @@ config = {
     },
 
     "handlers": {
-        "debugFileHandler": {
-            "class": "logging.handlers.RotatingFileHandler",
-            "formatter": "fileFormatter",
+        "queueHandler": {
+            "class": "logging.handlers.QueueHandler",
             "level": "DEBUG",
-            "filename": "{}".format(os.path.join(PATH, "debug.log")),
-            "mode": "a",
-            "maxBytes": 1024*10,
-            "backupCount": 3
-        },
-        "consoleFileHandler": {
-            "class": "logging.handlers.RotatingFileHandler",
-            "formatter": "fileFormatter",
-            "level": "INFO",
-            "filename": "{}".format(os.path.join(PATH, "console.log")),
-            "mode": "a",
-            "maxBytes": 1024*10,
-            "backupCount": 3
-        },
-        "errorFileHandler": {
-            "class": "logging.handlers.RotatingFileHandler",
-            "formatter": "fileFormatter",
-            "level": "ERROR",
-            "filename": "{}".format(os.path.join(PATH, "error.log")),
-            "mode": "a",
-            "maxBytes": 1024*10,
-            "backupCount": 3
+            "queue": "ext://logger.log_queue.LOG_QUEUE"
         },
         "streamHandler": {
             "class": "logging.StreamHandler",
@@ -77,6 +82,6 @@ config = {
 
     "root": {
         "level": "DEBUG",
-        "handlers": ["debugFileHandler", "consoleFileHandler", "errorFileHandler", "streamHandler"]
+        "handlers": ["queueHandler", "streamHandler"]
     }
 }
@@ -1,47 +1,49 @@
 #!python3
 
+from collections import Counter
+
+import numpy as np  # pip install numpy
+
+
+def mean_value(values):
+    """ Return mean of values. """
+    return float(np.asarray(values, dtype=np.float64).mean())
+
+
 def mean(values):
-    """ Print mean of values. """
-    mean = sum(values) / float(len(values))
-    print("  Mean: {:.4f}".format(mean))
+    """ Return formatted mean of values. """
+    return "  Mean: {:.4f}".format(mean_value(values))
 
 
-def median(values):
-    """ Print median of values. """
-    n = len(values)
-    values.sort()
-
-    if n % 2 == 0:
-        median1 = values[n//2]
-        median2 = values[n//2 - 1]
-        median = (median1 + median2) / 2.0
-    else:
-        median = values[n//2]
-    print("Median: {:.4f}".format(median))
+def median_value(values):
+    """ Return median of values without reordering them. """
+    return float(np.median(np.asarray(values, dtype=np.float64)))
 
 
-def mode(values):
-    """ Print mode of values. """
-    from collections import Counter
+def median(values):
+    """ Return formatted median of values. """
+    return "Median: {:.4f}".format(median_value(values))
 
-    n = len(values)
 
-    data = Counter(values)
-    get_mode = dict(data)
-    mode = ["{:.4f}".format(k) for k, v in get_mode.items() if v == max(list(data.values()))]
+def mode(values):
+    """ Return mode of values. """
+    counts = Counter(values)
+    top = counts.most_common(1)[0][1] if counts else 0
 
-    if len(mode) == n:
+    if top <= 1:
         get_mode = "No mode found"
     else:
-        get_mode = "  Mode: " + ', '.join(map(str, mode))
+        mode = ["{:.4f}".format(k) for k, v in counts.items() if v == top]
+        get_mode = "  Mode: " + ', '.join(mode)
 
-    print(get_mode)
+    return get_mode
 
 def test():
     values = [0.34, 0.65, 0.73, 0.23, 0.18, 0.18, 0.89, 0.45, 0.45, 0.32, 0.56]
-    mean(values)
-    median(values)
-    mode(values)
+    print(mean(values))
+    print(median(values))
+    print(mode(values))
+    assert mode([]) == "No mode found"
 
 if __name__ == "__main__":
     test()
\ No newline at end of file
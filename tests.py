@@ -8,10 +8,16 @@ Last Updated: 21 March 2020
 """
 
 # Standard library imports
+import io
 import os
 import time
+import hashlib
 import datetime as dt
 
+# Third-party library imports
+from botocore.response import StreamingBody
+from botocore.stub import Stubber
+
 
 #######################################################################
 def timeit(func, *args):
@@ -38,6 +44,10 @@ def delete_local(filepath):
 #######################################################################
 # TEST FUNCTIONS
 class BadlyWrittenTestClass(object):
+    """
+    Run every test against the same 's3_client' (an S3Session), so the
+    S3 client is only created once however many tests are run.
+    """
 
     def __init__(self, s3_client, local_directory, s3_bucket, s3_directory, test_file):
 
@@ -47,12 +57,13 @@ class BadlyWrittenTestClass(object):
         self.s3_dir = s3_directory
         self.test_file = test_file
         self.local_filepath = os.path.join(local_directory, test_file).replace("\\", "/")
-        self.s3_filepath = os.path.join(s3_bucket, s3_directory, test_file).replace("\\", "/")
+        self.s3_key = s3_client._s3_key(s3_directory, test_file)
+        self.s3_filepath = s3_client._s3_key(s3_bucket, self.s3_key)
 
     def test_noLocal_noRemote(self):
         print("\nTESTS WHEN FILE DOES NOT EXIST LOCALLY OR REMOTELY")
         delete_local(self.local_filepath)
-        self.s3_client.delete_file(self.s3_dir, self.test_file)
+        self.s3_client.delete_by_key(self.s3_key)
 
         # Test .get_contents(), file exists
         timeit(self.s3_client.get_contents, self.s3_dir, False)
@@ -88,7 +99,7 @@ class BadlyWrittenTestClass(object):
     def test_yesLocal_noRemote(self):
         print("\nTESTS WHEN FILE EXISTS LOCALLY BUT NOT REMOTELY")
         create_local(self.local_filepath)
-        self.s3_client.delete_file(self.s3_dir, self.test_file)
+        self.s3_client.delete_by_key(self.s3_key)
 
         # Test .get_contents(), file exists
         timeit(self.s3_client.get_contents, self.s3_dir, False)
@@ -139,7 +150,7 @@ class BadlyWrittenTestClass(object):
     def test_noLocal_yesRemote(self):
         print("\nTESTS WHEN FILE EXISTS REMOTELY BUT NOT LOCALLY")
         create_local(self.local_filepath)
-        self.s3_client.upload_file(self.local_dir, self.s3_dir, self.test_file)
+        self.s3_client.upload_by_key(self.local_filepath, self.s3_key)
         delete_local(self.local_filepath)
 
         # Test .get_contents(), file exists
@@ -176,7 +187,7 @@ class BadlyWrittenTestClass(object):
     def test_yesLocal_yesRemote(self):
         print("\nTESTS WHEN FILE EXISTS LOCALLY AND REMOTELY")
         create_local(self.local_filepath)
-        self.s3_client.upload_file(self.local_dir, self.s3_dir, self.test_file)
+        self.s3_client.upload_by_key(self.local_filepath, self.s3_key)
 
         # Test .get_contents(), file should exist
         timeit(self.s3_client.get_contents, self.s3_dir, False)
@@ -209,7 +220,13 @@ class BadlyWrittenTestClass(object):
     def test_objectAttributeDump(self):
         print("\nDUMP AVAILABLE OBJECT ATTRIBUTE DATA")
         create_local(self.local_filepath)
-        self.s3_client.upload_file(self.local_dir, self.s3_dir, self.test_file)
+        self.s3_client.upload_by_key(self.local_filepath, self.s3_key)
+
+        # Fetch all of the metadata up-front, with the HEAD requests for
+        # every file made concurrently. describe() and the attribute
+        # getters below then read from it without further requests.
+        timeit(self.s3_client.describe_many, [(self.s3_dir, self.test_file)], True)
+        timeit(self.s3_client.describe, self.s3_dir, self.test_file)
         timeit(self.s3_client._key_exists, self.s3_dir, self.test_file)
         timeit(self.s3_client.get_size, self.s3_dir, self.test_file, False)
         timeit(self.s3_client.get_content_type, self.s3_dir, self.test_file, False)
@@ -219,4 +236,57 @@ class BadlyWrittenTestClass(object):
         timeit(self.s3_client.get_expiry_date, self.s3_dir, self.test_file, False)
         timeit(self.s3_client.get_modified_date, self.s3_dir, self.test_file, False)
         delete_local(self.local_filepath)
-        self.s3_client.delete_file(self.s3_dir, self.test_file)
+        self.s3_client.delete_by_key(self.s3_key)
+
+    def test_stubbedDownload(self):
+        print("\nDOWNLOAD A SINGLE-PART FILE FROM A STUBBED CLIENT")
+        delete_local(self.local_filepath)
+        self.s3_client._head_cache.clear()
+        bucket = self.s3_client.bucket_name
+        body = b"This is a test file served by a stubbed client."
+        etag = '"{}"'.format(hashlib.md5(body).hexdigest())
+
+        # Test .download_file(), file is fetched with a single GET
+        with Stubber(self.s3_client.client) as stubber:
+            stubber.add_response(
+                "head_object", {"ContentLength": len(body), "ETag": etag},
+                {"Bucket": bucket, "Key": self.s3_key},
+            )
+            stubber.add_response(
+                "get_object", {"Body": StreamingBody(io.BytesIO(body), len(body)), "ContentLength": len(body)},
+                {"Bucket": bucket, "Key": self.s3_key, "IfMatch": etag},
+            )
+            timeit(self.s3_client.download_file, self.s3_dir, self.local_dir, self.test_file)
+            stubber.assert_no_pending_responses()
+
+        with open(self.local_filepath, "rb") as rf:
+            assert rf.read() == body
+        delete_local(self.local_filepath)
+        self.s3_client._head_cache.clear()
+
+    def test_stubbedListing(self):
+        print("\nLIST A DIRECTORY FROM A STUBBED CLIENT")
+        bucket = self.s3_client.bucket_name
+        prefix = self.s3_dir.rstrip("/") + "/"
+        keys = [prefix + "a.txt", prefix + "sub1/b.txt", prefix + "sub2/c.txt"]
+
+        # Test .get_contents(), one LIST for the directory and one for
+        # each of its folders. Any further request finds no response.
+        with Stubber(self.s3_client.client) as stubber:
+            stubber.add_response(
+                "list_objects_v2",
+                {
+                    "Contents": [{"Key": keys[0]}],
+                    "CommonPrefixes": [{"Prefix": prefix + "sub1/"}, {"Prefix": prefix + "sub2/"}],
+                    "IsTruncated": False,
+                },
+                {"Bucket": bucket, "Prefix": prefix, "Delimiter": "/"},
+            )
+            # The folders are listed concurrently, so they may be
+            # requested in either order.
+            for key in keys[1:]:
+                stubber.add_response("list_objects_v2", {"Contents": [{"Key": key}], "IsTruncated": False})
+            contents = self.s3_client.get_contents(self.s3_dir)
+            stubber.assert_no_pending_responses()
+
+        assert contents == keys